@@ -1,13 +1,9 @@
 # Stdlib Imports
-import json
-from typing import Dict, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 # Own Imports
 from async_paystack.services.base_paystack import PayStack
 
-# Third Party Imports
-import httpx
-
 
 class Plans(PayStack):
     """
@@ -33,40 +29,26 @@ class Plans(PayStack):
         Read More: https://paystack.com/docs/api/#plan-create
         """
 
-        async with httpx.AsyncClient() as client:
-            data = {"name": f"{name}", "interval": f"{interval}", "amount": int(amount)}
-            url = self.base_url + "plan"
-
-            response = await client.post(
-                url=url, headers=self.headers(), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
+        data = {"name": f"{name}", "interval": f"{interval}", "amount": int(amount)}
+        return await self._request("POST", "plan", data=data)
 
-            response_data = response.json()
-            return response_data["status"], response_data["message"]
-
-    async def list_plans(self) -> Tuple[bool, Union[Dict, str]]:
+    async def list_plans(
+        self, per_page: int = None, page: int = None
+    ) -> Tuple[bool, Union[List[Dict], str]]:
         """
         This function fetches list plans available on your integration
 
+        :param per_page: The number of plans to return per page
+        :type per_page: int
+        :param page: The page of plans to return
+        :type page: int
         :return: A tuple of two dictionaries.
 
         Read More: https://paystack.com/docs/api/#plan-list
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + "plan"
-            response = await client.get(url=url, headers=self.headers())
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["message"]
+        params = {"perPage": per_page, "page": page}
+        return await self._request("GET", "plan", params=params)
 
     async def fetch_plan(self, id_or_code: str) -> Tuple[bool, Union[Dict, str]]:
         """
@@ -79,16 +61,9 @@ class Plans(PayStack):
         Read More: https://paystack.com/docs/api/#plan-fetch
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + f"plan/{id_or_code}"
-            response = await client.get(url=url, headers=self.headers())
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["message"]
+        return await self._request(
+            "GET", "plan/{id_or_code}", path_params={"id_or_code": id_or_code}
+        )
 
     async def update_plan(
         self, id_or_code: str, name: str
@@ -105,16 +80,10 @@ class Plans(PayStack):
         Read More: https://paystack.com/docs/api/#plan-update
         """
 
-        async with httpx.AsyncClient() as client:
-            data = {"name": f"{name}"}
-            url = self.base_url + f"plan/{id_or_code}"
-            response = await client.put(
-                url, headers=self.headers(), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["message"]
+        data = {"name": f"{name}"}
+        return await self._request(
+            "PUT",
+            "plan/{id_or_code}",
+            path_params={"id_or_code": id_or_code},
+            data=data,
+        )
@@ -1,13 +1,9 @@
 # Stdlib Imports
-import json
-from typing import Dict, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 # Own Imports
 from async_paystack.services.base_paystack import PayStack
 
-# Third Party Imports
-import httpx
-
 
 class Subscriptions(PayStack):
     """
@@ -33,46 +29,33 @@ class Subscriptions(PayStack):
         Read More: https://paystack.com/docs/api/#subscription-create
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + "subscription"
-            data = {
-                "customer": f"{customer}",
-                "plan": f"{plan}",
-            }
-
-            if authorization:
-                data["authorization"] = f"{authorization}"
-
-            response = await client.post(
-                url=url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
+        data = {
+            "customer": f"{customer}",
+            "plan": f"{plan}",
+        }
 
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
+        if authorization:
+            data["authorization"] = f"{authorization}"
 
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        return await self._request("POST", "subscription", data=data)
 
-    async def list_subscriptions(self) -> Tuple[bool, Union[Dict, str]]:
+    async def list_subscriptions(
+        self, per_page: int = None, page: int = None
+    ) -> Tuple[bool, Union[List[Dict], str]]:
         """
         This function fetch subscriptions available on your integration.
 
+        :param per_page: The number of subscriptions to return per page
+        :type per_page: int
+        :param page: The page of subscriptions to return
+        :type page: int
         :return: A tuple of the status and the data.
 
-        Read More: https://paystack.com/docs/api/#subscription-create
+        Read More: https://paystack.com/docs/api/#subscription-list
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + "subscription"
-            response = await client.get(url=url, headers=json.dumps(self.headers()))
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        params = {"perPage": per_page, "page": page}
+        return await self._request("GET", "subscription", params=params)
 
     async def fetch_subscription(
         self, id_or_code: str
@@ -87,16 +70,9 @@ class Subscriptions(PayStack):
         Read More: https://paystack.com/docs/api/#subscription-fetch
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + f"subscription/{id_or_code}"
-            response = await client.get(url=url, headers=json.dumps(self.headers()))
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        return await self._request(
+            "GET", "subscription/{id_or_code}", path_params={"id_or_code": id_or_code}
+        )
 
     async def enable_subscription(
         self, code: str, token: str
@@ -113,20 +89,8 @@ class Subscriptions(PayStack):
         Read More: https://paystack.com/docs/api/#subscription-enable
         """
 
-        async with httpx.AsyncClient() as client:
-            data = {"code": f"{code}", "token": f"{token}"}
-            url = self.base_url + "subscription/enable"
-
-            response = await client.post(
-                url=url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        data = {"code": f"{code}", "token": f"{token}"}
+        return await self._request("POST", "subscription/enable", data=data)
 
     async def disable_subscription(
         self, code: str, token: str
@@ -143,20 +107,8 @@ class Subscriptions(PayStack):
         Read More: https://paystack.com/docs/api/#subscription-disable
         """
 
-        async with httpx.AsyncClient() as client:
-            data = {"code": f"{code}", "token": f"{token}"}
-            url = self.base_url + "subscription/disable"
-
-            response = await client.post(
-                url=url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        data = {"code": f"{code}", "token": f"{token}"}
+        return await self._request("POST", "subscription/disable", data=data)
 
     async def generate_update_subscription_link(
         self, code: str
@@ -171,20 +123,13 @@ class Subscriptions(PayStack):
         Read More: https://paystack.com/docs/api/#subscription-disable
         """
 
-        async with httpx.AsyncClient() as client:
-            data = {"code": f"{code}"}
-            url = self.base_url + f"subscription/{code}/manage/link/"
-
-            response = await client.post(
-                url=url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        data = {"code": f"{code}"}
+        return await self._request(
+            "POST",
+            "subscription/{code}/manage/link/",
+            path_params={"code": code},
+            data=data,
+        )
 
     async def send_update_subscription_link(
         self, code: str
@@ -200,17 +145,10 @@ class Subscriptions(PayStack):
         Read More: https://paystack.com/docs/api/#subscription-manage-email
         """
 
-        async with httpx.AsyncClient() as client:
-            data = {"code": f"{code}"}
-            url = self.base_url + f"subscription/{code}/manage/email/"
-
-            response = await client.post(
-                url=url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        data = {"code": f"{code}"}
+        return await self._request(
+            "POST",
+            "subscription/{code}/manage/email/",
+            path_params={"code": code},
+            data=data,
+        )
@@ -1,13 +1,9 @@
 # Stdlib Imports
-import json
-from typing import Dict, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 # Own Imports
 from async_paystack.services.base_paystack import PayStack
 
-# Third Party Imports
-import httpx
-
 
 class Transactions(PayStack):
     """
@@ -31,61 +27,60 @@ class Transactions(PayStack):
         :return::return:  A tuple of the status and the data.
         """
 
-        async with httpx.AsyncClient() as client:
-            data = {"email": f"{user_email}", "amount": int(amount)}
-            url = self.base_url + "transaction/initialize"
-            
-            if reference:
-                data["reference"] = reference
-            
-            response = await client.post(
-                url, headers=self.headers(), data=json.dumps(data)
-            )
+        data = {"email": f"{user_email}", "amount": int(amount)}
 
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
+        if reference:
+            data["reference"] = reference
 
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        return await self._request("POST", "transaction/initialize", data=data)
 
     async def verify_transaction(self, ref: str) -> Tuple[bool, Union[Dict, str]]:
         """
         This function verifies a transaction using the transaction reference
 
+        Verification sits on the checkout's critical path, so it is hedged
+        when the transport has a hedge policy.
+
         :param ref: The transaction reference number
         :type ref: str
         :return::return:  A tuple of the status and the data.
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + f"transaction/verify/{ref}"
-            response = await client.get(url, headers=self.headers())
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
-
-    async def list_transactions(self) -> Tuple[bool, Union[Dict, str]]:
+        return await self._request(
+            "GET", "transaction/verify/{ref}", path_params={"ref": ref}, hedge=True
+        )
+
+    async def list_transactions(
+        self,
+        per_page: int = None,
+        page: int = None,
+        from_date: str = None,
+        to_date: str = None,
+    ) -> Tuple[bool, Union[List[Dict], str]]:
         """
         This function gets list of transactions carried out on your integration.
 
-        :return::return:  A tuple of the status and the data.
-        """
+        :param per_page: The number of transactions to return per page
+        :type per_page: int
+        :param page: The page of transactions to return
+        :type page: int
+        :param from_date: A timestamp from which to start listing transactions
+        :type from_date: str
+        :param to_date: A timestamp at which to stop listing transactions
+        :type to_date: str
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + "transaction"
-            response = await client.get(url, headers=self.headers())
+        :return::return:  A tuple of the status and the data.
 
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
+        Read More: https://paystack.com/docs/api/#transaction-list
+        """
 
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        params = {
+            "perPage": per_page,
+            "page": page,
+            "from": from_date,
+            "to": to_date,
+        }
+        return await self._request("GET", "transaction", params=params)
 
     async def fetch_transaction(self, id: int) -> Tuple[bool, Union[Dict, str]]:
         """
@@ -94,16 +89,7 @@ class Transactions(PayStack):
         :return A tuple of two dictionaries.
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + f"transaction/{id}"
-            response = await client.get(url, headers=self.headers())
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        return await self._request("GET", "transaction/{id}", path_params={"id": id})
 
     async def charge_authorization(
         self, authorization_code: str, email: str, amount: str
@@ -120,23 +106,12 @@ class Transactions(PayStack):
         :return::return:  A tuple of the status and the data.
         """  # noqa: E501
 
-        async with httpx.AsyncClient() as client:
-            data = {
-                "authorization_code": f"{authorization_code}",
-                "email": f"{email}",
-                "amount": int(amount),
-            }
-            url = self.base_url + "transaction/charge_authorization"
-            response = await client.post(
-                url, headers=self.headers(), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        data = {
+            "authorization_code": f"{authorization_code}",
+            "email": f"{email}",
+            "amount": int(amount),
+        }
+        return await self._request("POST", "transaction/charge_authorization", data=data)
 
     async def check_authorization(
         self, email: str, amount: str, authorization_code: str
@@ -161,20 +136,9 @@ class Transactions(PayStack):
         :return::return:  A tuple of the status and the data.
         """
 
-        async with httpx.AsyncClient() as client:
-            data = {
-                "email": f"{email}",
-                "amount": f"{amount}",
-                "authorization_code": f"{authorization_code}",
-            }
-            url = self.base_url + "transaction/check_authorization"
-            response = await client.post(
-                url, headers=self.headers(), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        data = {
+            "email": f"{email}",
+            "amount": f"{amount}",
+            "authorization_code": f"{authorization_code}",
+        }
+        return await self._request("POST", "transaction/check_authorization", data=data)
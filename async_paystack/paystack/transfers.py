@@ -1,20 +1,21 @@
 # Stdlib Imports
-import json
-from typing import Dict, Tuple, Union
+from typing import Any, Dict, List, Tuple, Union
 
 # Own Imports
 from async_paystack.services.base_paystack import PayStack
 
-# Third Party Imports
-import httpx
-
 
 class Transfers(PayStack):
     """
     The Transfer API Wrapper allows you to send money to bank accounts
     and mobile money wallet.
+
+    A `BalanceTracker` built on an instance sets itself as `balance`, so
+    every transfer initiated through that instance debits its snapshot.
     """
 
+    balance: Any = None
+
     async def create_transfer_recipient(
         self, nuban: str, name: str, account_number: str, bank_code: str, currency: str
     ) -> Tuple[bool, Union[Dict, str]]:
@@ -36,29 +37,22 @@ class Transfers(PayStack):
         See More: https://paystack.com/docs/api/#transfer-recipient-create
         """  # noqa: E501
 
-        async with httpx.AsyncClient() as client:
-            data = {
-                "type": f"{nuban}",
-                "name": f"{name}",
-                "account_number": f"{account_number}",
-                "bank_code": f"{bank_code}",
-                "currency": f"{currency}",
-            }
-            url = self.base_url = "transferrecipient"
-
-            response = await client.post(
-                url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["message"]
+        data = {
+            "type": f"{nuban}",
+            "name": f"{name}",
+            "account_number": f"{account_number}",
+            "bank_code": f"{bank_code}",
+            "currency": f"{currency}",
+        }
+        return await self._request("POST", "transferrecipient", data=data)
 
     async def initiate_transfer(
-        self, source: str, amount: int, recipient_code: str, reason: str
+        self,
+        source: str,
+        amount: int,
+        recipient_code: str,
+        reason: str,
+        currency: str = None,
     ) -> Tuple[bool, Union[Dict, str]]:
         """
         This function initiates a transfer from your account to another account
@@ -71,30 +65,57 @@ class Transfers(PayStack):
         :type recipient_code: str
         :param reason: The reason for the transfer
         :type reason: str
+        :param currency: The currency of the transfer, defaults to the integration's (NGN)
+        :type currency: str
         :return: A tuple of the status and the data.
 
         See More: https://paystack.com/docs/api/#transfer-initiate
         """  # noqa: E501
 
-        async with httpx.AsyncClient() as client:
-            data = {
-                "source": f"{source}",
-                "amount": int(amount),
-                "recipient": f"{recipient_code}",
-                "reason": f"{reason}",
-            }
-            url = self.base_url + "transfer"
-
-            response = await client.post(
-                url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
+        data = {
+            "source": f"{source}",
+            "amount": int(amount),
+            "recipient": f"{recipient_code}",
+            "reason": f"{reason}",
+        }
+        if currency is not None:
+            data["currency"] = f"{currency}"
+
+        request = self._request("POST", "transfer", data=data)
+        if self.balance is None:
+            return await request
+        return await self.balance.track_transfer(amount, currency or "NGN", request)
+
+    async def list_transfers(
+        self,
+        per_page: int = None,
+        page: int = None,
+        from_date: str = None,
+        to_date: str = None,
+    ) -> Tuple[bool, Union[List[Dict], str]]:
+        """
+        This function lists the transfers made on your integration
+
+        :param per_page: The number of transfers to return per page
+        :type per_page: int
+        :param page: The page of transfers to return
+        :type page: int
+        :param from_date: A timestamp from which to start listing transfers
+        :type from_date: str
+        :param to_date: A timestamp at which to stop listing transfers
+        :type to_date: str
+        :return: A tuple of the status and the data.
 
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
+        See More: https://paystack.com/docs/api/#transfer-list
+        """
 
-            response_data = response.json()
-            return response_data["status"], response_data["message"]
+        params = {
+            "perPage": per_page,
+            "page": page,
+            "from": from_date,
+            "to": to_date,
+        }
+        return await self._request("GET", "transfer", params=params)
 
     async def complete_transfer(
         self, transfer_code: str, otp_code: str
@@ -111,17 +132,5 @@ class Transfers(PayStack):
         See More: https://paystack.com/docs/api/#transfer-finalize
         """  # noqa: E501
 
-        async with httpx.AsyncClient() as client:
-            data = {"transfer_code": f"{transfer_code}", "otp": f"{otp_code}"}
-            url = self.base_url + "transfer/finalize_transfer"
-
-            response = await client.post(
-                url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["message"]
+        data = {"transfer_code": f"{transfer_code}", "otp": f"{otp_code}"}
+        return await self._request("POST", "transfer/finalize_transfer", data=data)
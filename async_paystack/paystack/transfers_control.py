@@ -1,13 +1,9 @@
 # Stdlib Imports
-import json
 from typing import Dict, Tuple, Union
 
 # Own Imports
 from async_paystack.services.base_paystack import PayStack
 
-# Third Party Imports
-import httpx
-
 
 class TransfersControl(PayStack):
     """
@@ -23,16 +19,7 @@ class TransfersControl(PayStack):
         See More: https://paystack.com/docs/api/#transfer-control-balance
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + "balance"
-            response = await client.get(url=url, headers=json.dumps(self.headers()))
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        return await self._request("GET", "balance")
 
     async def fetch_ledger_balance(self) -> Tuple[bool, Union[Dict, str]]:
         """
@@ -43,16 +30,7 @@ class TransfersControl(PayStack):
         See More: https://paystack.com/docs/api/#transfer-control-balance-ledger
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + "balance/ledger"
-            response = await client.get(url=url, headers=json.dumps(self.headers()))
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        return await self._request("GET", "balance/ledger")
 
     async def resend_transfers_otp(
         self, transfer_code: str, reason: str
@@ -69,20 +47,8 @@ class TransfersControl(PayStack):
         See More: https://paystack.com/docs/api/#transfer-control-resend-otp
         """  # noqa: E501
 
-        async with httpx.AsyncClient() as client:
-            data = {"transfer_code": f"{transfer_code}", "reason": f"{reason}"}
-            url = self.base_url + "transfer/resend_otp"
-
-            response = await client.post(
-                url=url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        data = {"transfer_code": f"{transfer_code}", "reason": f"{reason}"}
+        return await self._request("POST", "transfer/resend_otp", data=data)
 
     async def disable_transfers_otp(self) -> Tuple[bool, Union[Dict, str]]:
         """
@@ -92,16 +58,7 @@ class TransfersControl(PayStack):
         See More: https://paystack.com/docs/api/#transfer-control-disable-otp
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + "transfer/disable_otp"
-            response = await client.post(url=url, headers=json.dumps(self.headers()))
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        return await self._request("POST", "transfer/disable_otp")
 
     async def finalize_disable_otp(self, otp: str) -> Tuple[bool, Union[Dict, str]]:
         """
@@ -114,20 +71,8 @@ class TransfersControl(PayStack):
         Read More: https://paystack.com/docs/api/#transfer-control-finalize-disable-otp
         """
 
-        async with httpx.AsyncClient() as client:
-            data = {"otp": f"{otp}"}
-            url = self.base_url + "transfer/disable_otp_finalize"
-
-            response = await client.post(
-                url=url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        data = {"otp": f"{otp}"}
+        return await self._request("POST", "transfer/disable_otp_finalize", data=data)
 
     async def enable_transfers_otp(self) -> Tuple[bool, Union[Dict, str]]:
         """
@@ -138,13 +83,4 @@ class TransfersControl(PayStack):
         See More: https://paystack.com/docs/api/#transfer-control-enable-otp
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + "transfer/enable_otp"
-            response = await client.post(url=url, headers=json.dumps(self.headers()))
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-            
-            response_data = response.json()
-            return response_data["status"], response_data["messsage"]
+        return await self._request("POST", "transfer/enable_otp")
@@ -1,13 +1,9 @@
 # Stdlib Imports
-import json
 from typing import Dict, Tuple, Union
 
 # Own Imports
 from async_paystack.services.base_paystack import PayStack
 
-# Third Party Imports
-import httpx
-
 
 class Verification(PayStack):
     """The Verification API Wrapper allows you perform KYC processes"""
@@ -27,19 +23,8 @@ class Verification(PayStack):
         Read More: https://paystack.com/docs/api#verification-resolve-account
         """ # noqa: E501
 
-        async with httpx.AsyncClient() as client:
-            url = (
-                self.base_url
-                + f"bank/resolve?account_number={account_number}&bank_code={bank_code}"
-            )
-            response = await client.get(url, headers=json.dumps(self.headers()))
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["message"]
+        params = {"account_number": f"{account_number}", "bank_code": f"{bank_code}"}
+        return await self._request("GET", "bank/resolve", params=params)
 
     async def validate_account_number(
         self,
@@ -74,27 +59,16 @@ class Verification(PayStack):
         See More: https://paystack.com/docs/api/#verification-validate-account
         """
 
-        async with httpx.AsyncClient() as client:
-            data = {
-                "bank_code": f"{bank_code}",
-                "country_code": f"{country_code}",
-                "account_number": f"{account_number}",
-                "account_name": f"{account_name}",
-                "account_type": f"{account_type}",
-                "document_type": f"{document_type}",
-                "document_number": f"{document_number}",
-            }
-            url = self.base_url + "bank/validate"
-            response = await client.post(
-                url, headers=json.dumps(self.headers()), data=json.dumps(data)
-            )
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["message"]
+        data = {
+            "bank_code": f"{bank_code}",
+            "country_code": f"{country_code}",
+            "account_number": f"{account_number}",
+            "account_name": f"{account_name}",
+            "account_type": f"{account_type}",
+            "document_type": f"{document_type}",
+            "document_number": f"{document_number}",
+        }
+        return await self._request("POST", "bank/validate", data=data)
 
     async def resolve_card_bin(self, bin: str) -> Tuple[bool, Union[Dict, str]]:
         """
@@ -108,13 +82,4 @@ class Verification(PayStack):
         Read More: https://paystack.com/docs/api/#verification-resolve-card
         """
 
-        async with httpx.AsyncClient() as client:
-            url = self.base_url + f"decision/bin/{bin}"
-            response = await client.get(url=url, headers=json.dumps(self.headers()))
-
-            if response.status_code == 200:
-                response_data = response.json()
-                return response_data["status"], response_data["data"]
-
-            response_data = response.json()
-            return response_data["status"], response_data["message"]
+        return await self._request("GET", "decision/bin/{bin}", path_params={"bin": bin})
@@ -0,0 +1,148 @@
+# Stdlib Imports
+import asyncio
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple, Union
+
+# Own Imports
+from async_paystack.paystack.verification import Verification
+
+# Third Party Imports
+import httpx
+
+
+Account = Tuple[str, str]
+Resolution = Tuple[bool, Union[Dict, str]]
+
+
+class AccountResolver:
+    """
+    Batch front-end for `Verification.resolves_account_number`.
+
+    Inputs are deduplicated, successful resolutions are kept in a bounded
+    LRU cache, and every bank code gets its own concurrency cap so a bank
+    that resolves slowly can't hold all of the global slots.
+    """
+
+    def __init__(
+        self,
+        verification: Verification,
+        max_concurrency: int = 32,
+        per_bank_concurrency: int = 4,
+        bank_concurrency: Dict[str, int] = None,
+        cache_size: int = 10_000,
+    ) -> None:
+        self.verification = verification
+        self.max_concurrency = max_concurrency
+        self.per_bank_concurrency = per_bank_concurrency
+        self.bank_concurrency = bank_concurrency or {}
+        self.cache_size = cache_size
+
+        self._cache: "OrderedDict[Account, Resolution]" = OrderedDict()
+        self._pending: Dict[Account, asyncio.Future] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._bank_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def cached(self, account_number: str, bank_code: str) -> Optional[Resolution]:
+        """
+        This function returns a cached resolution, if there is one
+
+        :param account_number: The account number
+        :type account_number: str
+        :param bank_code: The bank code
+        :type bank_code: str
+        :return: The cached status and data, or None.
+        """
+
+        key = (account_number, bank_code)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        return None
+
+    def _bank_semaphore(self, bank_code: str) -> asyncio.Semaphore:
+        if bank_code not in self._bank_slots:
+            limit = self.bank_concurrency.get(bank_code, self.per_bank_concurrency)
+            self._bank_slots[bank_code] = asyncio.Semaphore(limit)
+        return self._bank_slots[bank_code]
+
+    async def _fetch(self, account_number: str, bank_code: str) -> Resolution:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+
+        # Wait on the bank first, so calls queued behind a slow bank don't
+        # sit on global slots that other banks could be using.
+        async with self._bank_semaphore(bank_code), self._slots:
+            try:
+                return await self.verification.resolves_account_number(
+                    account_number, bank_code
+                )
+            except httpx.HTTPError as exc:
+                return False, str(exc)
+
+    async def resolve(self, account_number: str, bank_code: str) -> Resolution:
+        """
+        This function resolves a single account, sharing the result with
+        concurrent callers asking for the same account
+
+        :param account_number: The account number
+        :type account_number: str
+        :param bank_code: The bank code
+        :type bank_code: str
+        :return: A tuple of the status and the data.
+        """
+
+        key = (account_number, bank_code)
+        cached = self.cached(*key)
+        if cached is not None:
+            return cached
+
+        if key not in self._pending:
+            self._pending[key] = asyncio.ensure_future(self._fetch(*key))
+
+        future = self._pending[key]
+        try:
+            resolution = await asyncio.shield(future)
+        finally:
+            if future.done():
+                self._pending.pop(key, None)
+
+        if resolution[0]:
+            self._cache[key] = resolution
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return resolution
+
+    async def resolve_many(
+        self, accounts: Iterable[Account]
+    ) -> AsyncIterator[Tuple[Account, Resolution]]:
+        """
+        This function resolves a batch of `(account_number, bank_code)` pairs
+
+        Cached accounts are yielded first, the rest as soon as each one
+        resolves, so results don't come back in input order.
+
+        :param accounts: The `(account_number, bank_code)` pairs to resolve
+        :type accounts: Iterable[Account]
+        :return: An async iterator of `(account, (status, data))` pairs.
+        """
+
+        tasks: Dict[asyncio.Future, Account] = {}
+        for account in dict.fromkeys(accounts):
+            cached = self.cached(*account)
+            if cached is not None:
+                yield account, cached
+            else:
+                tasks[asyncio.ensure_future(self.resolve(*account))] = account
+
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield tasks[task], task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,263 @@
+# Stdlib Imports
+import asyncio
+import itertools
+import time
+from typing import Awaitable, Dict, List, Optional, Tuple, Union
+
+# Own Imports
+from async_paystack.paystack.transfers import Transfers
+from async_paystack.paystack.transfers_control import TransfersControl
+from async_paystack.services.exceptions import PayStackError
+
+# Third Party Imports
+import httpx
+
+
+class OptimisticDebit:
+    """
+    A transfer debited from the snapshot ahead of Paystack's own balance.
+    """
+
+    __slots__ = ("currency", "amount", "generation", "in_flight")
+
+    def __init__(self, currency: str, amount: int, generation: int) -> None:
+        self.currency = currency
+        self.amount = amount
+        # The refresh generation current when the transfer was initiated
+        self.generation = generation
+        self.in_flight = True
+
+
+class BalanceTracker:
+    """
+    Local snapshot of the integration's balance per currency.
+
+    The snapshot is refreshed from `balance` in a background task, debited
+    optimistically by every transfer initiated through `transfers` (directly,
+    through `initiate_transfer` or e.g. a `TransferOTPOrchestrator` built on
+    the same instance), and re-synced from `balance/ledger` whenever the
+    outcome of a transfer is unknown. Payout gating then becomes a local
+    lookup:
+
+        async with BalanceTracker(TransfersControl(), Transfers()) as tracker:
+            if tracker.can_pay(amount):
+                status, data = await tracker.initiate_transfer(...)
+    """
+
+    def __init__(
+        self,
+        transfers_control: TransfersControl,
+        transfers: Transfers,
+        refresh_interval: float = 30.0,
+    ) -> None:
+        self.transfers_control = transfers_control
+        self.transfers = transfers
+        self.refresh_interval = refresh_interval
+        self.synced_at: Optional[float] = None
+
+        self._balances: Dict[str, int] = {}
+        # Debits a refreshed balance may not reflect yet. Rejected transfers
+        # are dropped straight away, so they can never be counted twice.
+        self._debits: Dict[int, OptimisticDebit] = {}
+        self._ids = itertools.count()
+        self._generation = 0
+        self._stale = False
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        transfers.balance = self
+
+    def available(self, currency: str = "NGN") -> Optional[int]:
+        """
+        This function returns the cached balance for a currency
+
+        :param currency: The currency of the balance
+        :type currency: str
+        :return: The balance in the currency's subunit, or None if unknown.
+        """
+
+        return self._balances.get(currency)
+
+    def can_pay(self, amount: int, currency: str = "NGN") -> bool:
+        """
+        This function checks the cached balance can cover an amount
+
+        :param amount: The amount in the currency's subunit
+        :type amount: int
+        :param currency: The currency of the amount
+        :type currency: str
+        :return: True if the cached balance covers the amount.
+        """
+
+        balance = self._balances.get(currency)
+        return balance is not None and balance >= amount
+
+    async def refresh(self) -> None:
+        """
+        This function reloads the snapshot from the `balance` endpoint
+        """
+
+        generation = self._next_generation()
+        status, data = await self.transfers_control.check_balance()
+        if not status:
+            raise PayStackError(data)
+
+        balances = [(entry["currency"], entry["balance"]) for entry in data]
+        self._apply(balances, generation)
+
+    async def resync(self) -> None:
+        """
+        This function reloads the snapshot from the newest `balance/ledger`
+        entry of each currency, which already accounts for pay-outs.
+        """
+
+        generation = self._next_generation()
+        status, data = await self.transfers_control.fetch_ledger_balance()
+        if not status:
+            raise PayStackError(data)
+
+        latest: Dict[str, int] = {}
+        for entry in data:
+            latest.setdefault(entry["currency"], entry["balance"])
+        self._apply(list(latest.items()), generation)
+        self._stale = False
+
+    def _next_generation(self) -> int:
+        self._generation += 1
+        return self._generation
+
+    def _apply(self, balances: List[Tuple[str, int]], generation: int) -> None:
+        # A balance fetched by refresh `generation` is assumed to include
+        # transfers that completed before it started. Transfers still in
+        # flight, or initiated since, may be missing from it.
+        unreflected: Dict[str, int] = {}
+        for debit in self._debits.values():
+            if debit.in_flight or debit.generation >= generation:
+                unreflected[debit.currency] = (
+                    unreflected.get(debit.currency, 0) + debit.amount
+                )
+
+        for currency, balance in balances:
+            self._balances[currency] = balance - unreflected.get(currency, 0)
+        self.synced_at = time.monotonic()
+
+        self._debits = {
+            key: debit
+            for key, debit in self._debits.items()
+            if debit.in_flight or debit.generation >= generation
+        }
+
+    async def initiate_transfer(
+        self,
+        source: str,
+        amount: int,
+        recipient_code: str,
+        reason: str,
+        currency: str = "NGN",
+    ) -> Tuple[bool, Union[Dict, str]]:
+        """
+        This function initiates a transfer after checking the cached balance
+
+        :param source: The source (balance) wallet or account to debit the funds from
+        :type source: str
+        :param amount: The amount to be transferred
+        :type amount: int
+        :param recipient_code: The recipient's code
+        :type recipient_code: str
+        :param reason: The reason for the transfer
+        :type reason: str
+        :param currency: The currency of the transfer
+        :type currency: str
+        :return: A tuple of the status and the data.
+        """  # noqa: E501
+
+        if not self.can_pay(amount, currency):
+            return False, "Insufficient balance"
+
+        return await self.transfers.initiate_transfer(
+            source, amount, recipient_code, reason, currency=currency
+        )
+
+    async def track_transfer(
+        self,
+        amount: int,
+        currency: str,
+        request: Awaitable[Tuple[bool, Union[Dict, str]]],
+    ) -> Tuple[bool, Union[Dict, str]]:
+        """
+        This function debits a transfer from the snapshot around its request
+
+        The amount is debited before the request goes out, and credited back
+        if Paystack rejects the transfer. Called by `Transfers.initiate_transfer`.
+
+        :param amount: The amount of the transfer
+        :type amount: int
+        :param currency: The currency of the transfer
+        :type currency: str
+        :param request: The pending `transfer` request
+        :type request: Awaitable[Tuple[bool, Union[Dict, str]]]
+        :return: A tuple of the status and the data.
+        """
+
+        key = next(self._ids)
+        debit = self._debits[key] = OptimisticDebit(currency, amount, self._generation)
+        self._balances[currency] = self._balances.get(currency, 0) - amount
+        try:
+            status, data = await request
+        except BaseException:
+            # The transfer may or may not have gone through, so only the
+            # ledger can tell what the balance really is now.
+            debit.in_flight = False
+            self._stale = True
+            if self._wake is not None:
+                self._wake.set()
+            raise
+
+        debit.in_flight = False
+        if not status:
+            del self._debits[key]
+            self._balances[currency] += amount
+        return status, data
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.refresh_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                await (self.resync() if self._stale else self.refresh())
+            except (PayStackError, httpx.HTTPError):
+                # Keep serving the last snapshot, the next tick will retry
+                pass
+
+    async def start(self) -> None:
+        """
+        This function loads the first snapshot and starts the background refresh
+        """
+
+        await self.refresh()
+        self._wake = asyncio.Event()
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """
+        This function stops the background refresh
+        """
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self) -> "BalanceTracker":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
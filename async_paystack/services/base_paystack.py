@@ -1,18 +1,110 @@
+# Stdlib Imports
+import json
+from typing import Dict, Tuple, Union
+
+# Own Imports
+from async_paystack.services.profiling import Profiler
+from async_paystack.services.transport import Transport
+
 # Third party Imports
+import httpx
 from decouple import config as env
 
 
 class PayStack:
     """
     Base Paystack Async API Wrapper
+
+    Used as an async context manager, an instance opens and closes the
+    pooled client of its own transport. A `transport` passed in belongs to
+    the caller, who opens and closes it.
     """
-    
-    def __init__(self) -> None:
+
+    def __init__(
+        self,
+        transport: Transport = None,
+        priority: str = None,
+        profiler: Profiler = None,
+    ) -> None:
         self.base_url = env("PAYSTACK_BASE_URL")
         self.secret_key = env("PAYSTACK_SECRET_KEY")
-    
+        self.owns_transport = transport is None
+        self.transport = transport or Transport()
+        self.priority = priority
+        self.profiler = profiler
+
     def headers(self) -> dict:
         return {
         "Authorization": f"Bearer {self.secret_key}",
         "Content-Type": "application/json"
-    }
\ No newline at end of file
+    }
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict = None,
+        data: dict = None,
+        hedge: bool = False,
+        path_params: dict = None,
+    ) -> Tuple[bool, Union[Dict, str]]:
+        """
+        This function sends a request to Paystack through the transport
+
+        :param method: The HTTP method
+        :type method: str
+        :param path: The path of the endpoint, relative to the base url, with \
+            `{name}` placeholders for the values in `path_params`
+        :type path: str
+        :param params: The query parameters, `None` values are left out
+        :type params: dict
+        :param data: The JSON body of the request
+        :type data: dict
+        :param hedge: Whether the transport may hedge this (idempotent) request
+        :type hedge: bool
+        :param path_params: The values of the placeholders in `path`
+        :type path_params: dict
+        :return: A tuple of the status and the data (or message on failure).
+        """
+
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
+
+        response = self.transport.request(
+            method,
+            self.base_url + path.format(**path_params or {}),
+            headers=self.headers(),
+            params=params,
+            content=json.dumps(data) if data is not None else None,
+            hedge=hedge,
+            priority=self.priority,
+        )
+
+        if self.profiler is None:
+            return self._decode(await response)
+
+        # Aggregate under the path template, e.g. `GET transaction/verify/{ref}`
+        return await self.profiler.profile(f"{method} {path}", response, self._decode)
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> Tuple[bool, Union[Dict, str]]:
+        try:
+            response_data = response.json()
+        except ValueError:
+            # e.g. an HTML error page from a proxy or load balancer
+            return False, response.text
+        if response.is_success:
+            # Some endpoints (e.g. `transfer/resend_otp`) only send a message
+            if "data" not in response_data:
+                return response_data["status"], response_data["message"]
+            return response_data["status"], response_data["data"]
+        return response_data["status"], response_data["message"]
+
+    async def __aenter__(self):
+        if self.owns_transport:
+            await self.transport.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self.owns_transport:
+            await self.transport.aclose()
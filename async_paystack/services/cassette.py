@@ -0,0 +1,165 @@
+# Stdlib Imports
+import asyncio
+import gzip
+import json
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Tuple
+
+# Own Imports
+from async_paystack.services.exceptions import PayStackError
+
+# Third Party Imports
+import httpx
+
+
+RequestKey = Tuple[str, str, str, str]
+
+
+class CassetteMiss(PayStackError):
+    """
+    Raised when a replayed request has no recorded interaction.
+    """
+
+
+def _request_key(request: httpx.Request) -> RequestKey:
+    # Only the path is kept, so a cassette recorded against one base url
+    # replays against any other (and never holds the secret key).
+    return (
+        request.method,
+        request.url.path,
+        request.url.query.decode(),
+        request.content.decode(),
+    )
+
+
+class Cassette:
+    """
+    Recorded request/response pairs.
+
+    On disk a cassette is newline-delimited JSON, one compact interaction
+    per line, gzipped when the path ends with `.gz`.
+    """
+
+    def __init__(self, interactions: List[Dict] = None) -> None:
+        self.interactions: List[Dict] = interactions or []
+
+    @staticmethod
+    def _open(path: str, mode: str):
+        if path.endswith(".gz"):
+            return gzip.open(path, mode + "t", encoding="utf-8")
+        return open(path, mode, encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with cls._open(path, "r") as file:
+            return cls([json.loads(line) for line in file if line.strip()])
+
+    def save(self, path: str) -> None:
+        with self._open(path, "w") as file:
+            for interaction in self.interactions:
+                file.write(json.dumps(interaction, separators=(",", ":")) + "\n")
+
+    def record(
+        self, request: httpx.Request, response: httpx.Response, elapsed: float
+    ) -> None:
+        method, path, query, body = _request_key(request)
+        self.interactions.append(
+            {
+                "method": method,
+                "path": path,
+                "query": query,
+                "body": body,
+                "status": response.status_code,
+                "response": response.text,
+                "elapsed": round(elapsed, 6),
+            }
+        )
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that forwards requests and records every exchange:
+
+        cassette = Cassette()
+        recorder = RecordingTransport(cassette)
+        async with Transport(http_transport=recorder) as transport:
+            ...
+        cassette.save("paystack.ndjson.gz")
+
+    Record through an opened `Transport`, since a short-lived client
+    closes the transport underneath it when it is done.
+    """
+
+    def __init__(
+        self, cassette: Cassette, transport: httpx.AsyncBaseTransport = None
+    ) -> None:
+        self.cassette = cassette
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        content = await response.aread()
+        elapsed = time.perf_counter() - started
+        await response.aclose()
+
+        # `content` is already decompressed, so drop the encoding headers
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in ("content-encoding", "content-length")
+        ]
+        recorded = httpx.Response(
+            response.status_code, headers=headers, content=content
+        )
+        self.cassette.record(request, recorded, elapsed)
+        return recorded
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that answers requests from a cassette, without network.
+
+    Requests are matched on method, path, query and body. Repeated requests
+    get the recorded responses in order and then start over, so a small
+    cassette can drive long runs. Each response is delayed by its recorded
+    latency divided by `speed`; the default `speed=0` answers immediately,
+    which isolates the library's own overhead.
+    """
+
+    def __init__(self, cassette: Cassette, speed: float = 0) -> None:
+        self.speed = speed
+        self.replayed = 0
+        self._interactions: Dict[RequestKey, Deque[Dict]] = defaultdict(deque)
+        for interaction in cassette.interactions:
+            key = (
+                interaction["method"],
+                interaction["path"],
+                interaction["query"],
+                interaction["body"],
+            )
+            self._interactions[key].append(interaction)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        interactions = self._interactions.get(_request_key(request))
+        if not interactions:
+            raise CassetteMiss(
+                f"No recorded interaction for {request.method} {request.url}"
+            )
+
+        interaction = interactions[0]
+        interactions.rotate(-1)
+
+        if self.speed:
+            await asyncio.sleep(interaction["elapsed"] / self.speed)
+
+        self.replayed += 1
+        return httpx.Response(
+            interaction["status"],
+            headers={"Content-Type": "application/json"},
+            content=interaction["response"].encode(),
+        )
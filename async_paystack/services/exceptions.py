@@ -0,0 +1,11 @@
+class PayStackError(Exception):
+    """
+    Raised when a Paystack call fails where a `(status, message)` tuple
+    cannot be handed back to the caller, e.g. inside an async iterator.
+    """
+
+
+class TransportClosed(PayStackError):
+    """
+    Raised when a request is made on a transport that is draining.
+    """
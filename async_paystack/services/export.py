@@ -0,0 +1,185 @@
+# Stdlib Imports
+import asyncio
+import csv
+import json
+from typing import Any, Dict, List, Sequence
+
+# Own Imports
+from async_paystack.services.pagination import PageFetcher, paginate
+
+
+def project(record: Dict, fields: Sequence[str]) -> Dict:
+    """
+    This function picks `fields` out of a record
+
+    Nested values are addressed with dotted paths, e.g. `customer.email`.
+    Missing values come back as `None`.
+
+    :param record: The record returned by a list endpoint
+    :type record: Dict
+    :param fields: The (dotted) field paths to keep
+    :type fields: Sequence[str]
+    :return: A flat dictionary keyed by field path.
+    """
+
+    projected = {}
+    for field in fields:
+        value: Any = record
+        for key in field.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        projected[field] = value
+    return projected
+
+
+class NDJSONSink:
+    """
+    Writes one JSON document per line.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write(self, records: List[Dict]) -> None:
+        self.file.writelines(
+            json.dumps(record, default=str) + "\n" for record in records
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class CSVSink:
+    """
+    Writes records as CSV rows, with `fields` as the header.
+
+    `fields` also serves as the projection of an export that doesn't pass
+    its own. Nested values (dicts and lists) are written as JSON.
+    """
+
+    def __init__(self, path: str, fields: Sequence[str]) -> None:
+        self.fields = list(fields)
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.writer = csv.DictWriter(
+            self.file, fieldnames=self.fields, extrasaction="ignore"
+        )
+        self.writer.writeheader()
+
+    def write(self, records: List[Dict]) -> None:
+        self.writer.writerows(
+            {
+                field: json.dumps(value, default=str)
+                if isinstance(value, (dict, list))
+                else value
+                for field, value in record.items()
+            }
+            for record in records
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ParquetSink:
+    """
+    Writes records to a Parquet file, one row group per page.
+
+    Requires `pyarrow` (`pip install pyarrow`). The schema is inferred
+    from the first page, so pass `fields` to the export to keep it stable.
+    """
+
+    def __init__(self, path: str) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as exc:
+            raise ImportError(
+                "ParquetSink requires pyarrow, install it with `pip install pyarrow`"
+            ) from exc
+
+        self.pyarrow = pyarrow
+        self.parquet = pyarrow.parquet
+        self.path = path
+        self.writer = None
+
+    def write(self, records: List[Dict]) -> None:
+        if self.writer is None:
+            table = self.pyarrow.Table.from_pylist(records)
+            self.writer = self.parquet.ParquetWriter(self.path, table.schema)
+        else:
+            table = self.pyarrow.Table.from_pylist(records, schema=self.writer.schema)
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def export(
+    fetch_page: PageFetcher,
+    sink: Any,
+    fields: Sequence[str] = None,
+    per_page: int = 100,
+    max_pending_pages: int = 2,
+    **filters: Any,
+) -> int:
+    """
+    This function streams every record of a list endpoint into a sink
+
+    Pages are handed from the fetcher to the writer through a bounded queue,
+    so at most `max_pending_pages` pages are held in memory and the fetcher
+    waits whenever the writer falls behind. Sink writes run in a worker
+    thread to keep file I/O off the event loop. The sink is closed once the
+    export finishes or fails.
+
+    :param fetch_page: A list method of a service class, e.g. `list_transfers`
+    :type fetch_page: PageFetcher
+    :param sink: A `NDJSONSink`, `CSVSink`, `ParquetSink` or any object \
+        with `write(records)` and `close()` methods
+    :type sink: Any
+    :param fields: The (dotted) field paths to export, defaults to the \
+        sink's own `fields` (e.g. the columns of a `CSVSink`), then whole records
+    :type fields: Sequence[str]
+    :param per_page: The number of records to request per page
+    :type per_page: int
+    :param max_pending_pages: The number of fetched pages allowed to wait \
+        for the writer
+    :type max_pending_pages: int
+    :param filters: Extra keyword arguments passed on to `fetch_page`, \
+        e.g. `from_date`
+    :type filters: Any
+    :return: The number of records written.
+    """
+
+    fields = fields or getattr(sink, "fields", None)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending_pages)
+
+    async def fetch() -> None:
+        async for page in paginate(fetch_page, per_page, **filters):
+            await queue.put(page)
+        await queue.put(None)
+
+    fetcher = asyncio.ensure_future(fetch())
+    written = 0
+
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, fetcher}, return_when=asyncio.FIRST_COMPLETED)
+
+            if not getter.done() and fetcher.exception() is not None:
+                getter.cancel()
+                fetcher.result()
+
+            page = await getter
+            if page is None:
+                break
+
+            if fields:
+                page = [project(record, fields) for record in page]
+            await asyncio.to_thread(sink.write, page)
+            written += len(page)
+    finally:
+        fetcher.cancel()
+        sink.close()
+
+    return written
@@ -0,0 +1,80 @@
+# Stdlib Imports
+from collections import deque
+
+
+class HedgePolicy:
+    """
+    Decides when (and whether) a `Transport` may hedge an idempotent request.
+
+    The hedge delay follows the observed latency at `percentile`, so only the
+    slow tail gets a second request. Every request earns `budget` hedge
+    tokens and every hedge spends one, which caps hedges at roughly `budget`
+    of the traffic (10% by default) however slow Paystack gets.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.01,
+        budget: float = 0.1,
+        burst: float = 10.0,
+        window: int = 1000,
+        min_samples: int = 20,
+    ) -> None:
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.budget = budget
+        self.burst = burst
+        self.min_samples = min_samples
+
+        self.hedged = 0
+        self._tokens = 0.0
+        self._latencies: deque = deque(maxlen=window)
+
+    def record(self, latency: float) -> None:
+        """
+        This function records the latency of a completed request, or how
+        long a cancelled one ran, which is a lower bound of its latency
+
+        :param latency: The latency in seconds
+        :type latency: float
+        """
+
+        self._latencies.append(latency)
+
+    def delay(self) -> float:
+        """
+        This function returns how long to wait before hedging a request
+
+        :return: The delay in seconds.
+        """
+
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay
+
+        latencies = sorted(self._latencies)
+        index = min(int(len(latencies) * self.percentile), len(latencies) - 1)
+        return max(latencies[index], self.min_delay)
+
+    def on_request(self) -> None:
+        """
+        This function credits the hedge budget for a new request
+        """
+
+        self._tokens = min(self._tokens + self.budget, self.burst)
+
+    def try_hedge(self) -> bool:
+        """
+        This function spends a hedge token, if the budget allows it
+
+        :return: True if the request may be hedged.
+        """
+
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        self.hedged += 1
+        return True
@@ -0,0 +1,41 @@
+# Stdlib Imports
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple, Union
+
+# Own Imports
+from async_paystack.services.exceptions import PayStackError
+
+
+PageFetcher = Callable[..., Awaitable[Tuple[bool, Union[List[Dict], str]]]]
+
+
+async def paginate(
+    fetch_page: PageFetcher, per_page: int = 100, **filters: Any
+) -> AsyncIterator[List[Dict]]:
+    """
+    This function walks a paginated list endpoint page by page
+
+    Only one page is held in memory at a time, and the walk stops at the
+    first page that comes back shorter than `per_page`.
+
+    :param fetch_page: A list method of a service class, e.g. `list_transactions`
+    :type fetch_page: PageFetcher
+    :param per_page: The number of records to request per page
+    :type per_page: int
+    :param filters: Extra keyword arguments passed on to `fetch_page`
+    :type filters: Any
+    :return: An async iterator of pages (lists of records).
+    """
+
+    page = 1
+    while True:
+        status, data = await fetch_page(per_page=per_page, page=page, **filters)
+        if not status:
+            raise PayStackError(data)
+
+        if data:
+            yield data
+
+        if len(data) < per_page:
+            return
+
+        page += 1
@@ -0,0 +1,174 @@
+# Stdlib Imports
+import json
+import time
+import tracemalloc
+from typing import Awaitable, Callable, Dict, Tuple, Union
+
+# Third Party Imports
+import httpx
+
+
+class EndpointStats:
+    """
+    Aggregated measurements of one endpoint.
+    """
+
+    __slots__ = (
+        "calls",
+        "response_bytes",
+        "max_response_bytes",
+        "decode_seconds",
+        "max_decode_seconds",
+        "total_seconds",
+        "peak_allocated_bytes",
+        "overlapped_calls",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.response_bytes = 0
+        self.max_response_bytes = 0
+        self.decode_seconds = 0.0
+        self.max_decode_seconds = 0.0
+        self.total_seconds = 0.0
+        self.peak_allocated_bytes = 0
+        self.overlapped_calls = 0
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        calls = self.calls or 1
+        return {
+            "calls": self.calls,
+            "response_bytes": self.response_bytes,
+            "avg_response_bytes": self.response_bytes / calls,
+            "max_response_bytes": self.max_response_bytes,
+            "avg_decode_ms": self.decode_seconds / calls * 1000,
+            "max_decode_ms": self.max_decode_seconds * 1000,
+            "avg_total_ms": self.total_seconds / calls * 1000,
+            "peak_allocated_bytes": self.peak_allocated_bytes,
+            "overlapped_calls": self.overlapped_calls,
+        }
+
+
+class Profiler:
+    """
+    Records response size, decode time and peak Python allocations per
+    endpoint for the service classes it is handed to:
+
+        profiler = Profiler()
+        subscriptions = Subscriptions(profiler=profiler)
+        ...
+        profiler.dump("paystack-profile.json")
+
+    Allocation peaks come from `tracemalloc`, which is started by the
+    profiler if it isn't tracing already. Its peak is process-wide, so it is
+    only reset when no profiled call is in flight: a call that runs alone
+    gets its own peak, while calls that overlap share the peak of the whole
+    overlap, an upper bound for each of them. `overlapped_calls` counts the
+    calls measured that way; serialize calls for exact per-call figures.
+    Service classes created without a profiler skip all of this.
+    """
+
+    # Profiled calls in flight across all profilers, tracemalloc is global
+    _in_flight = 0
+
+    def __init__(self, trace_allocations: bool = True) -> None:
+        self.trace_allocations = trace_allocations
+        self.stats: Dict[str, EndpointStats] = {}
+
+        self._started_tracing = trace_allocations and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+
+    async def profile(
+        self,
+        endpoint: str,
+        response: Awaitable[httpx.Response],
+        decode: Callable[[httpx.Response], Tuple[bool, Union[Dict, str]]],
+    ) -> Tuple[bool, Union[Dict, str]]:
+        """
+        This function awaits and decodes a response, recording its measurements
+
+        :param endpoint: The name the measurements are aggregated under
+        :type endpoint: str
+        :param response: The pending response
+        :type response: Awaitable[httpx.Response]
+        :param decode: The function turning the response into a result
+        :type decode: Callable
+        :return: The decoded result.
+        """
+
+        tracing = self.trace_allocations and tracemalloc.is_tracing()
+        overlapped = Profiler._in_flight > 0
+        if tracing:
+            baseline = tracemalloc.get_traced_memory()[0]
+            if not overlapped:
+                tracemalloc.reset_peak()
+
+        Profiler._in_flight += 1
+        try:
+            started = time.perf_counter()
+            received = await response
+            decode_started = time.perf_counter()
+            result = decode(received)
+            finished = time.perf_counter()
+        finally:
+            Profiler._in_flight -= 1
+            overlapped = overlapped or Profiler._in_flight > 0
+
+        stats = self.stats.get(endpoint)
+        if stats is None:
+            stats = self.stats[endpoint] = EndpointStats()
+
+        size = len(received.content)
+        stats.calls += 1
+        stats.response_bytes += size
+        stats.max_response_bytes = max(stats.max_response_bytes, size)
+        stats.decode_seconds += finished - decode_started
+        stats.max_decode_seconds = max(
+            stats.max_decode_seconds, finished - decode_started
+        )
+        stats.total_seconds += finished - started
+
+        stats.overlapped_calls += overlapped
+
+        if tracing:
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            stats.peak_allocated_bytes = max(stats.peak_allocated_bytes, peak)
+
+        return result
+
+    def report(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        This function returns the measurements so far, keyed by endpoint
+
+        :return: A dictionary of per-endpoint measurements.
+        """
+
+        return {endpoint: stats.as_dict() for endpoint, stats in self.stats.items()}
+
+    def dump(self, path: str) -> None:
+        """
+        This function writes the report to a JSON file
+
+        :param path: The path of the file to write
+        :type path: str
+        """
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.report(), file, indent=2)
+
+    def close(self) -> None:
+        """
+        This function stops `tracemalloc`, if this profiler started it
+        """
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def reset(self) -> None:
+        """
+        This function discards the measurements so far
+        """
+
+        self.stats.clear()
@@ -0,0 +1,103 @@
+# Stdlib Imports
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Tuple
+
+
+class PriorityScheduler:
+    """
+    Weighted fair queue in front of a `Transport`.
+
+    At most `max_concurrency` requests are sent at once. Requests waiting
+    for a slot are served by start-time fair queuing over their priority
+    class, so with the default weights a checkout call queued behind bulk
+    work jumps ahead of it, while bulk work still gets a share of the slots
+    (and every slot nobody else wants):
+
+        scheduler = PriorityScheduler(max_concurrency=10)
+        async with Transport(scheduler=scheduler) as transport:
+            checkout = Transactions(transport=transport, priority="interactive")
+            exports = Transactions(transport=transport, priority="bulk")
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        weights: Dict[str, float] = None,
+        default_priority: str = "interactive",
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.weights = weights or {"interactive": 8.0, "bulk": 1.0}
+        self.default_priority = default_priority
+
+        self._active = 0
+        self._virtual_time = 0.0
+        self._last_finish: Dict[str, float] = {}
+        self._queue: List[Tuple[float, int, float, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    async def acquire(self, priority: str = None) -> None:
+        """
+        This function waits for a free slot for a request of `priority`
+
+        :param priority: The priority class, defaults to `default_priority`
+        :type priority: str
+        """
+
+        priority = priority or self.default_priority
+        if priority not in self.weights:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+        # Slots are handed straight to queued requests on release, so a free
+        # slot means nobody is waiting.
+        if self._active < self.max_concurrency:
+            self._active += 1
+            return
+
+        start = max(self._virtual_time, self._last_finish.get(priority, 0.0))
+        finish = start + 1 / self.weights[priority]
+        self._last_finish[priority] = finish
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (finish, next(self._sequence), start, waiter))
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before cancellation
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """
+        This function frees a slot and hands it to the next queued request
+        """
+
+        self._active -= 1
+        while self._queue:
+            _, _, start, waiter = heapq.heappop(self._queue)
+            if waiter.done():
+                continue
+
+            self._virtual_time = start
+            self._active += 1
+            waiter.set_result(None)
+            return
+
+    @asynccontextmanager
+    async def slot(self, priority: str = None) -> AsyncIterator[None]:
+        """
+        This function holds a slot for the duration of the `async with` block
+
+        :param priority: The priority class, defaults to `default_priority`
+        :type priority: str
+        """
+
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
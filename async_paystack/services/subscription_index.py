@@ -0,0 +1,228 @@
+# Stdlib Imports
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+# Own Imports
+from async_paystack.paystack.plans import Plans
+from async_paystack.paystack.subscriptions import Subscriptions
+from async_paystack.services.pagination import paginate
+
+
+# Statuses that still entitle the customer to the plan; `non-renewing`
+# subscriptions stay active until the end of the paid period.
+ACTIVE_STATUSES = frozenset({"active", "non-renewing", "attention"})
+
+
+def _keys(value: Union[Dict, int, str, None], *fields: str) -> List[str]:
+    """
+    Every key a nested customer or plan can be looked up by, e.g. its id,
+    its code and (for customers) its email.
+    """
+
+    if value is None:
+        return []
+    if not isinstance(value, dict):
+        return [str(value)]
+    return [str(value[field]) for field in fields if value.get(field) is not None]
+
+
+def _customer_keys(subscription: Dict) -> List[str]:
+    return _keys(subscription.get("customer"), "id", "customer_code", "email")
+
+
+def _plan_keys(subscription: Dict) -> List[str]:
+    return _keys(subscription.get("plan"), "id", "plan_code")
+
+
+class SubscriptionIndex:
+    """
+    Local read-through index of plans and subscriptions.
+
+    `warm` loads every plan and subscription through the list endpoints,
+    `apply_event` keeps the index current from `subscription.*` webhook
+    events, and entitlement checks become dictionary lookups:
+
+        index = SubscriptionIndex(Plans(), Subscriptions())
+        await index.warm()
+        index.is_active("CUS_xnxdt6s1zg1f4nx", "PLN_gx2wn530m0i3w3m")
+
+    Plans and subscriptions are indexed by id and code, subscriptions also
+    by customer (id, code or email). `plan` and `subscription` fall back to
+    the API on a miss and index what they fetch; `is_active` and
+    `customer_subscriptions` only answer from the index, so they need `warm`
+    to have run first.
+    """
+
+    def __init__(
+        self, plans: Plans, subscriptions: Subscriptions, per_page: int = 100
+    ) -> None:
+        self.plans_api = plans
+        self.subscriptions_api = subscriptions
+        self.per_page = per_page
+
+        self._plans: Dict[str, Dict] = {}
+        self._subscriptions: Dict[str, Dict] = {}
+        self._by_customer: Dict[str, Set[str]] = {}
+        self._active: Dict[Tuple[str, str], Set[str]] = {}
+        self.warmed = False
+
+    async def warm(self) -> None:
+        """
+        This function (re)builds the index from every plan and subscription
+
+        Plans and subscriptions deleted since the last `warm` are dropped.
+        The current index keeps answering until the new one is complete.
+        """
+
+        plans, subscriptions = [], []
+        async for page in paginate(self.plans_api.list_plans, self.per_page):
+            plans.extend(page)
+        async for page in paginate(
+            self.subscriptions_api.list_subscriptions, self.per_page
+        ):
+            subscriptions.extend(page)
+
+        self._plans, self._subscriptions = {}, {}
+        self._by_customer, self._active = {}, {}
+        for plan in plans:
+            self.add_plan(plan)
+        for subscription in subscriptions:
+            self.add_subscription(subscription)
+        self.warmed = True
+
+    def add_plan(self, plan: Dict) -> None:
+        """
+        This function adds (or replaces) a plan in the index
+
+        :param plan: The plan, as returned by the plans API
+        :type plan: Dict
+        """
+
+        for key in _keys(plan, "id", "plan_code"):
+            self._plans[key] = plan
+
+    def add_subscription(self, subscription: Dict) -> None:
+        """
+        This function adds (or replaces) a subscription in the index
+
+        :param subscription: The subscription, as returned by the \
+            subscriptions API or a webhook event
+        :type subscription: Dict
+        """
+
+        code = subscription["subscription_code"]
+        previous = self._subscriptions.get(code)
+        if previous is not None:
+            self._unindex(previous)
+
+        for key in _keys(subscription, "id", "subscription_code"):
+            self._subscriptions[key] = subscription
+
+        for customer in _customer_keys(subscription):
+            self._by_customer.setdefault(customer, set()).add(code)
+            if subscription.get("status") in ACTIVE_STATUSES:
+                for plan in _plan_keys(subscription):
+                    self._active.setdefault((customer, plan), set()).add(code)
+
+    def _unindex(self, subscription: Dict) -> None:
+        code = subscription["subscription_code"]
+        for key in _keys(subscription, "id", "subscription_code"):
+            self._subscriptions.pop(key, None)
+
+        for customer in _customer_keys(subscription):
+            codes = self._by_customer.get(customer)
+            if codes is not None:
+                codes.discard(code)
+                if not codes:
+                    del self._by_customer[customer]
+            for plan in _plan_keys(subscription):
+                codes = self._active.get((customer, plan))
+                if codes is not None:
+                    codes.discard(code)
+                    if not codes:
+                        del self._active[(customer, plan)]
+
+    def apply_event(self, event: Dict) -> None:
+        """
+        This function updates the index from a webhook event
+
+        Only `subscription.*` events carry subscription state; other events
+        are ignored.
+
+        :param event: The webhook payload, `{"event": ..., "data": {...}}`
+        :type event: Dict
+        """
+
+        data = event.get("data") or {}
+        if not event.get("event", "").startswith("subscription."):
+            return
+        if "subscription_code" not in data:
+            return
+
+        previous = self._subscriptions.get(data["subscription_code"])
+        # Webhook payloads can be partial, keep what we already knew
+        self.add_subscription({**previous, **data} if previous else data)
+
+    def is_active(self, customer: Union[int, str], plan: Union[int, str]) -> bool:
+        """
+        This function checks a customer has an active subscription to a plan
+
+        :param customer: The customer's id, code or email
+        :type customer: Union[int, str]
+        :param plan: The plan's id or code
+        :type plan: Union[int, str]
+        :return: True if the customer is entitled to the plan.
+        """
+
+        if not self.warmed:
+            raise RuntimeError("SubscriptionIndex is not warmed")
+        return bool(self._active.get((str(customer), str(plan))))
+
+    def customer_subscriptions(self, customer: Union[int, str]) -> List[Dict]:
+        """
+        This function lists the indexed subscriptions of a customer
+
+        :param customer: The customer's id, code or email
+        :type customer: Union[int, str]
+        :return: A list of subscriptions.
+        """
+
+        if not self.warmed:
+            raise RuntimeError("SubscriptionIndex is not warmed")
+        codes = self._by_customer.get(str(customer), ())
+        return [self._subscriptions[code] for code in codes]
+
+    async def plan(self, id_or_code: Union[int, str]) -> Optional[Dict]:
+        """
+        This function looks a plan up, fetching it on a miss
+
+        :param id_or_code: The ID or code of the plan
+        :type id_or_code: Union[int, str]
+        :return: The plan, or None if Paystack doesn't know it either.
+        """
+
+        plan = self._plans.get(str(id_or_code))
+        if plan is None:
+            status, data = await self.plans_api.fetch_plan(id_or_code)
+            if not status:
+                return None
+            self.add_plan(data)
+            plan = data
+        return plan
+
+    async def subscription(self, id_or_code: Union[int, str]) -> Optional[Dict]:
+        """
+        This function looks a subscription up, fetching it on a miss
+
+        :param id_or_code: The ID or code of the subscription
+        :type id_or_code: Union[int, str]
+        :return: The subscription, or None if Paystack doesn't know it either.
+        """
+
+        subscription = self._subscriptions.get(str(id_or_code))
+        if subscription is None:
+            status, data = await self.subscriptions_api.fetch_subscription(id_or_code)
+            if not status:
+                return None
+            self.add_subscription(data)
+            subscription = data
+        return subscription
@@ -0,0 +1,210 @@
+# Stdlib Imports
+import asyncio
+import heapq
+import time
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+
+# Own Imports
+from async_paystack.paystack.transactions import Transactions
+
+# Third Party Imports
+import httpx
+
+
+TERMINAL_STATUSES = frozenset({"success", "failed", "abandoned", "reversed"})
+
+
+class StatusChange(NamedTuple):
+    """
+    Emitted by `TransactionPoller` whenever a reference changes status.
+
+    `previous` is None the first time a status is seen.
+    """
+
+    reference: str
+    previous: Optional[str]
+    status: str
+    data: Dict
+
+
+class TrackedReference:
+    """
+    Polling state of one pending reference.
+    """
+
+    __slots__ = ("reference", "status", "interval", "due_at")
+
+    def __init__(
+        self, reference: str, status: Optional[str], interval: float
+    ) -> None:
+        self.reference = reference
+        self.status = status
+        self.interval = interval
+        self.due_at = time.monotonic()
+
+
+class TransactionPoller:
+    """
+    Polls `Transactions.verify_transaction` for pending references.
+
+    Every `tick` the references that are due are collected into one batch
+    and handed to a bounded pool of workers. A reference starts out polled
+    every `min_interval` seconds; each poll that finds it unchanged
+    stretches its interval by `backoff` (up to `max_interval`), and a
+    status change snaps it back. References are dropped once they reach a
+    terminal status:
+
+        async with TransactionPoller(Transactions()) as poller:
+            poller.track("reference")
+            async for change in poller.events():
+                ...
+    """
+
+    def __init__(
+        self,
+        transactions: Transactions,
+        workers: int = 8,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 2.0,
+        tick: float = 0.5,
+    ) -> None:
+        self.transactions = transactions
+        self.workers = workers
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.tick = tick
+
+        self.polls = 0
+        self.tracked: Dict[str, TrackedReference] = {}
+        self._due: List[Tuple[float, str]] = []
+        self._jobs: Optional[asyncio.Queue] = None
+        self._events: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def track(self, reference: str, status: str = None) -> None:
+        """
+        This function starts polling a reference, if it isn't polled already
+
+        :param reference: The transaction reference
+        :type reference: str
+        :param status: The status the reference is known to have, if any
+        :type status: str
+        """
+
+        if reference in self.tracked:
+            return
+
+        tracked = TrackedReference(reference, status, self.min_interval)
+        self.tracked[reference] = tracked
+        heapq.heappush(self._due, (tracked.due_at, reference))
+
+    def untrack(self, reference: str) -> None:
+        """
+        This function stops polling a reference
+
+        :param reference: The transaction reference
+        :type reference: str
+        """
+
+        self.tracked.pop(reference, None)
+
+    async def events(self) -> AsyncIterator[StatusChange]:
+        """
+        This function streams status changes as they are observed
+
+        :return: An async iterator of status changes.
+        """
+
+        if self._events is None:
+            raise RuntimeError("TransactionPoller is not started")
+
+        while True:
+            yield await self._events.get()
+
+    def _collect_due(self) -> List[TrackedReference]:
+        now = time.monotonic()
+        batch = []
+        while self._due and self._due[0][0] <= now:
+            due_at, reference = heapq.heappop(self._due)
+            tracked = self.tracked.get(reference)
+            # Skip untracked references and stale heap entries
+            if tracked is not None and tracked.due_at == due_at:
+                batch.append(tracked)
+        return batch
+
+    async def _schedule(self) -> None:
+        while True:
+            for tracked in self._collect_due():
+                self._jobs.put_nowait(tracked)
+            await asyncio.sleep(self.tick)
+
+    async def _poll(self, tracked: TrackedReference) -> None:
+        self.polls += 1
+        try:
+            status, data = await self.transactions.verify_transaction(
+                tracked.reference
+            )
+        except (httpx.HTTPError, ValueError, KeyError):
+            # A failed poll counts as no change, the reference is polled again
+            # later. `TransportClosed` isn't caught: it stops the worker.
+            status, data = False, None
+
+        # Untracked (or re-tracked) while the poll was in flight
+        if self.tracked.get(tracked.reference) is not tracked:
+            return
+
+        if status and data.get("status") != tracked.status:
+            change = StatusChange(
+                tracked.reference, tracked.status, data["status"], data
+            )
+            tracked.status = data["status"]
+            tracked.interval = self.min_interval
+            self._events.put_nowait(change)
+        else:
+            tracked.interval = min(tracked.interval * self.backoff, self.max_interval)
+
+        if tracked.status in TERMINAL_STATUSES:
+            self.untrack(tracked.reference)
+            return
+
+        tracked.due_at = time.monotonic() + tracked.interval
+        heapq.heappush(self._due, (tracked.due_at, tracked.reference))
+
+    async def _work(self) -> None:
+        while True:
+            await self._poll(await self._jobs.get())
+
+    async def start(self) -> None:
+        """
+        This function starts the scheduler and the worker pool
+        """
+
+        self._jobs = asyncio.Queue()
+        self._events = self._events or asyncio.Queue()
+
+        # Re-queue everything, including references left in flight by `stop`
+        self._due = [(tracked.due_at, ref) for ref, tracked in self.tracked.items()]
+        heapq.heapify(self._due)
+        self._tasks = [
+            asyncio.ensure_future(self._work()) for _ in range(self.workers)
+        ]
+        self._tasks.append(asyncio.ensure_future(self._schedule()))
+
+    async def stop(self) -> None:
+        """
+        This function stops polling; tracked references are kept
+        """
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def __aenter__(self) -> "TransactionPoller":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
@@ -0,0 +1,303 @@
+# Stdlib Imports
+import asyncio
+import hashlib
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Own Imports
+from async_paystack.paystack.transactions import Transactions
+from async_paystack.services.exceptions import PayStackError
+from async_paystack.services.pagination import paginate
+
+
+Watermark = Tuple[str, int]
+# (id, createdAt, digest, still pending)
+DigestEntry = Tuple[int, str, str, bool]
+
+# Statuses a transaction can still move on from
+PENDING_STATUSES = frozenset({"pending", "ongoing", "processing", "queued"})
+
+
+class TransactionChange(NamedTuple):
+    """
+    A single entry of the change stream emitted by `TransactionSync`.
+
+    `kind` is either "created" (first time the record is seen) or
+    "updated" (the record changed since it was last seen).
+    """
+
+    kind: str
+    record: Dict
+
+
+class CheckpointStore(ABC):
+    """
+    Base checkpoint store used by `TransactionSync` to remember the
+    `(createdAt, id)` watermark of a stream and a digest of every record
+    still inside the look-back window or still pending.
+    """
+
+    @abstractmethod
+    def get_watermark(self, stream: str) -> Optional[Watermark]:
+        ...
+
+    @abstractmethod
+    def set_watermark(self, stream: str, watermark: Watermark) -> None:
+        ...
+
+    @abstractmethod
+    def get_digest(self, stream: str, record_id: int) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    def put_digests(self, stream: str, entries: Sequence[DigestEntry]) -> None:
+        """
+        This function stores the digests of a batch of records at once
+        """
+
+    @abstractmethod
+    def pending_ids(self, stream: str, before: str) -> List[int]:
+        """
+        This function lists the pending records created before `before`,
+        which a sync pass no longer lists and has to re-check by id.
+        """
+
+    @abstractmethod
+    def prune(self, stream: str, before: str) -> None:
+        """
+        This function forgets digests of settled records created before
+        `before`, since those records will never be fetched again.
+        """
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store that lives for as long as the process does.
+    """
+
+    def __init__(self) -> None:
+        self._watermarks: Dict[str, Watermark] = {}
+        self._digests: Dict[Tuple[str, int], Tuple[str, str, bool]] = {}
+
+    def get_watermark(self, stream: str) -> Optional[Watermark]:
+        return self._watermarks.get(stream)
+
+    def set_watermark(self, stream: str, watermark: Watermark) -> None:
+        self._watermarks[stream] = watermark
+
+    def get_digest(self, stream: str, record_id: int) -> Optional[str]:
+        entry = self._digests.get((stream, record_id))
+        return entry[1] if entry else None
+
+    def put_digests(self, stream: str, entries: Sequence[DigestEntry]) -> None:
+        for record_id, created_at, digest, pending in entries:
+            self._digests[(stream, record_id)] = (created_at, digest, pending)
+
+    def pending_ids(self, stream: str, before: str) -> List[int]:
+        return [
+            key[1]
+            for key, (created_at, _, pending) in self._digests.items()
+            if key[0] == stream and pending and created_at < before
+        ]
+
+    def prune(self, stream: str, before: str) -> None:
+        self._digests = {
+            key: entry
+            for key, entry in self._digests.items()
+            if key[0] != stream or entry[0] >= before or entry[2]
+        }
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store persisted to a SQLite file, so a restarted worker
+    resumes from its last watermark instead of re-downloading everything.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS watermarks (
+                stream TEXT PRIMARY KEY, created_at TEXT NOT NULL, id INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS digests (
+                stream TEXT NOT NULL, id INTEGER NOT NULL,
+                created_at TEXT NOT NULL, digest TEXT NOT NULL,
+                pending INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (stream, id)
+            );
+            """
+        )
+
+    def get_watermark(self, stream: str) -> Optional[Watermark]:
+        row = self.connection.execute(
+            "SELECT created_at, id FROM watermarks WHERE stream = ?", (stream,)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set_watermark(self, stream: str, watermark: Watermark) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)",
+                (stream, *watermark),
+            )
+
+    def get_digest(self, stream: str, record_id: int) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT digest FROM digests WHERE stream = ? AND id = ?",
+            (stream, record_id),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put_digests(self, stream: str, entries: Sequence[DigestEntry]) -> None:
+        # One transaction (and one fsync) per batch rather than per record
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?)",
+                [(stream, *entry) for entry in entries],
+            )
+
+    def pending_ids(self, stream: str, before: str) -> List[int]:
+        rows = self.connection.execute(
+            "SELECT id FROM digests WHERE stream = ? AND pending AND created_at < ?",
+            (stream, before),
+        )
+        return [row[0] for row in rows]
+
+    def prune(self, stream: str, before: str) -> None:
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM digests "
+                "WHERE stream = ? AND created_at < ? AND NOT pending",
+                (stream, before),
+            )
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def _created_at(record: Dict) -> str:
+    return record.get("createdAt") or record.get("created_at")
+
+
+def _shift(timestamp: str, delta: timedelta) -> str:
+    if not delta:
+        return timestamp
+
+    # Keep Paystack's own `2016-09-29T00:00:00.000Z` shape, so shifted
+    # timestamps still compare correctly against stored `createdAt` strings.
+    moment = datetime.fromisoformat(timestamp.replace("Z", "+00:00")) - delta
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _digest(record: Dict) -> str:
+    payload = json.dumps(record, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class TransactionSync:
+    """
+    Incremental sync engine over `Transactions.list_transactions`.
+
+    Each pass only lists transactions created from the stored watermark
+    minus a small `lookback` (for records that show up late), and emits a
+    change for records that are new or whose content changed. Transactions
+    that were still pending when they left that window are re-checked one
+    by one through `fetch_transaction` until they settle, so a pending to
+    success change is seen without re-listing old windows.
+    """
+
+    def __init__(
+        self,
+        transactions: Transactions,
+        store: CheckpointStore = None,
+        stream: str = "transactions",
+        per_page: int = 100,
+        lookback: timedelta = timedelta(minutes=5),
+    ) -> None:
+        self.transactions = transactions
+        self.store = store or MemoryCheckpointStore()
+        self.stream = stream
+        self.per_page = per_page
+        self.lookback = lookback
+
+    def _compare(
+        self, record: Dict
+    ) -> Tuple[Optional[TransactionChange], Optional[DigestEntry]]:
+        digest = _digest(record)
+        previous = self.store.get_digest(self.stream, record["id"])
+        if previous == digest:
+            return None, None
+
+        kind = "created" if previous is None else "updated"
+        pending = record.get("status") in PENDING_STATUSES
+        entry = (record["id"], _created_at(record), digest, pending)
+        return TransactionChange(kind, record), entry
+
+    async def sync(self) -> AsyncIterator[TransactionChange]:
+        """
+        This function runs a single sync pass
+
+        Digests are stored a page at a time, once the consumer has taken the
+        page's changes, and the watermark only moves once the pass completes,
+        so an interrupted pass is replayed rather than lost.
+
+        :return: An async iterator of the changes found in this pass.
+        """
+
+        watermark = self.store.get_watermark(self.stream)
+        from_date = _shift(watermark[0], self.lookback) if watermark else None
+        newest = watermark
+
+        async for page in paginate(
+            self.transactions.list_transactions, self.per_page, from_date=from_date
+        ):
+            entries = []
+            for record in page:
+                change, entry = self._compare(record)
+                if change is not None:
+                    yield change
+                    entries.append(entry)
+
+                created_at = _created_at(record)
+                if newest is None or (created_at, record["id"]) > tuple(newest):
+                    newest = (created_at, record["id"])
+            self.store.put_digests(self.stream, entries)
+
+        if from_date is not None:
+            entries = []
+            for record_id in self.store.pending_ids(self.stream, from_date):
+                status, record = await self.transactions.fetch_transaction(record_id)
+                if not status:
+                    raise PayStackError(record)
+
+                change, entry = self._compare(record)
+                if change is not None:
+                    yield change
+                    entries.append(entry)
+            self.store.put_digests(self.stream, entries)
+
+        if newest is None:
+            return
+
+        self.store.set_watermark(self.stream, newest)
+        self.store.prune(self.stream, _shift(newest[0], self.lookback))
+
+    async def watch(self, interval: float = 60) -> AsyncIterator[TransactionChange]:
+        """
+        This function runs a sync pass every `interval` seconds, forever
+
+        :param interval: The number of seconds to sleep between passes
+        :type interval: float
+        :return: An async iterator of changes across all passes.
+        """
+
+        while True:
+            async for change in self.sync():
+                yield change
+
+            await asyncio.sleep(interval)
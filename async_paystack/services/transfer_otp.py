@@ -0,0 +1,305 @@
+# Stdlib Imports
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+# Own Imports
+from async_paystack.paystack.transfers import Transfers
+from async_paystack.paystack.transfers_control import TransfersControl
+
+# Third Party Imports
+import httpx
+
+
+Result = Tuple[bool, Union[Dict, str]]
+
+
+class PendingTransfer:
+    """
+    A transfer waiting for its OTP.
+    """
+
+    __slots__ = (
+        "transfer_code",
+        "future",
+        "lock",
+        "queued",
+        "sent_at",
+        "resends",
+        "last_error",
+    )
+
+    def __init__(self, transfer_code: str, future: asyncio.Future) -> None:
+        self.transfer_code = transfer_code
+        self.future = future
+        # Held while an OTP is being finalized, so two OTPs for the same
+        # transfer are tried one after the other
+        self.lock = asyncio.Lock()
+        # OTPs submitted but not yet picked up by a worker
+        self.queued = 0
+        self.sent_at = time.monotonic()
+        self.resends = 0
+        self.last_error: Optional[str] = None
+
+
+class TransferOTPOrchestrator:
+    """
+    Drives OTP-protected transfers from initiation to finalization.
+
+    Transfers that come back from `initiate` waiting for an OTP are kept in
+    an index keyed by transfer code. Any number of coroutines can `wait` for
+    a transfer to be finalized, OTPs handed to `submit_otp` are finalized
+    concurrently by a pool of workers, and OTPs that don't arrive within
+    `otp_timeout` are resent (at most `max_resends_per_minute` across all
+    transfers) before the transfer is given up on. The outcome of the last
+    `settled_size` transfers is kept for late waiters:
+
+        async with TransferOTPOrchestrator(Transfers(), TransfersControl()) as otp:
+            status, data = await otp.initiate("balance", 5000, "RCP_x", "Payout")
+            ...
+            otp.submit_otp(data["transfer_code"], "123456")  # e.g. from an operator
+            status, data = await otp.wait(data["transfer_code"])
+    """
+
+    def __init__(
+        self,
+        transfers: Transfers,
+        transfers_control: TransfersControl,
+        workers: int = 8,
+        otp_timeout: float = 120.0,
+        max_resends: int = 3,
+        max_resends_per_minute: int = 5,
+        check_interval: float = 5.0,
+        settled_size: int = 10_000,
+    ) -> None:
+        self.transfers = transfers
+        self.transfers_control = transfers_control
+        self.workers = workers
+        self.otp_timeout = otp_timeout
+        self.max_resends = max_resends
+        self.max_resends_per_minute = max_resends_per_minute
+        self.check_interval = check_interval
+        self.settled_size = settled_size
+
+        self.pending: Dict[str, PendingTransfer] = {}
+        self.settled: "OrderedDict[str, Result]" = OrderedDict()
+        self._resent_at: deque = deque()
+        self._otps: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def initiate(
+        self,
+        source: str,
+        amount: int,
+        recipient_code: str,
+        reason: str,
+        currency: str = None,
+    ) -> Result:
+        """
+        This function initiates a transfer and tracks it if it needs an OTP
+
+        :param source: The source (balance) wallet or account to debit the funds from
+        :type source: str
+        :param amount: The amount to be transferred
+        :type amount: int
+        :param recipient_code: The recipient's code
+        :type recipient_code: str
+        :param reason: The reason for the transfer
+        :type reason: str
+        :param currency: The currency of the transfer
+        :type currency: str
+        :return: A tuple of the status and the data.
+        """  # noqa: E501
+
+        status, data = await self.transfers.initiate_transfer(
+            source, amount, recipient_code, reason, currency=currency
+        )
+
+        if status and data.get("status") == "otp":
+            code = data["transfer_code"]
+            future = asyncio.get_running_loop().create_future()
+            self.pending[code] = PendingTransfer(code, future)
+        return status, data
+
+    async def wait(self, transfer_code: str, timeout: float = None) -> Result:
+        """
+        This function waits for a tracked transfer to be finalized
+
+        A transfer that was already settled returns its outcome straight away.
+
+        :param transfer_code: The transfer code returned by `initiate`
+        :type transfer_code: str
+        :param timeout: The number of seconds to wait, defaults to no limit
+        :type timeout: float
+        :return: A tuple of the status and the data (or message if the \
+            transfer was given up on).
+        """
+
+        pending = self.pending.get(transfer_code)
+        if pending is None:
+            if transfer_code in self.settled:
+                return self.settled[transfer_code]
+            return False, f"Transfer {transfer_code} is not awaiting an OTP"
+
+        # Shielded, so a waiter timing out doesn't cancel it for other waiters
+        return await asyncio.wait_for(asyncio.shield(pending.future), timeout)
+
+    def submit_otp(self, transfer_code: str, otp: str) -> None:
+        """
+        This function queues an OTP for finalization
+
+        :param transfer_code: The transfer code the OTP belongs to
+        :type transfer_code: str
+        :param otp: The OTP
+        :type otp: str
+        """
+
+        if self._otps is None:
+            raise RuntimeError("TransferOTPOrchestrator is not started")
+
+        pending = self.pending.get(transfer_code)
+        if pending is not None:
+            pending.queued += 1
+        self._otps.put_nowait((transfer_code, otp))
+
+    def _settle(self, pending: PendingTransfer, result: Result) -> None:
+        self.pending.pop(pending.transfer_code, None)
+        self.settled[pending.transfer_code] = result
+        if len(self.settled) > self.settled_size:
+            self.settled.popitem(last=False)
+        if not pending.future.done():
+            pending.future.set_result(result)
+
+    async def _finalize(self) -> None:
+        while True:
+            transfer_code, otp = await self._otps.get()
+            try:
+                await self._finalize_one(transfer_code, otp)
+            finally:
+                self._otps.task_done()
+
+    async def _finalize_one(self, transfer_code: str, otp: str) -> None:
+        pending = self.pending.get(transfer_code)
+        if pending is None:
+            return
+
+        async with pending.lock:
+            pending.queued -= 1
+            # Settled by an OTP finalized while this one waited
+            if self.pending.get(transfer_code) is not pending:
+                return
+            status, data = await self._call(
+                self.transfers.complete_transfer, transfer_code, otp
+            )
+
+            if status:
+                self._settle(pending, (status, data))
+            else:
+                # Wrong or expired OTP, keep waiting for another one
+                pending.last_error = data
+
+    @staticmethod
+    async def _call(function: Callable[..., Awaitable[Result]], *args: str) -> Result:
+        # A network failure is reported as a failed call, so it can't take a
+        # worker or the resend loop down
+        try:
+            return await function(*args)
+        except httpx.HTTPError as exc:
+            return False, str(exc)
+
+    def _may_resend(self) -> bool:
+        now = time.monotonic()
+        while self._resent_at and now - self._resent_at[0] > 60:
+            self._resent_at.popleft()
+        return len(self._resent_at) < self.max_resends_per_minute
+
+    async def _resend_expired(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+
+            now = time.monotonic()
+            expired = [
+                pending
+                for pending in self.pending.values()
+                if now - pending.sent_at >= self.otp_timeout
+            ]
+            for pending in sorted(expired, key=lambda pending: pending.sent_at):
+                # Settled meanwhile, or an OTP for it is queued or being
+                # finalized: it must not be given up on under that OTP
+                if self.pending.get(pending.transfer_code) is not pending:
+                    continue
+                if pending.queued or pending.lock.locked():
+                    continue
+
+                if pending.resends >= self.max_resends:
+                    message = pending.last_error or "OTP was not provided in time"
+                    self._settle(pending, (False, message))
+                    continue
+
+                if not self._may_resend():
+                    break
+
+                self._resent_at.append(time.monotonic())
+                pending.resends += 1
+                pending.sent_at = time.monotonic()
+                status, data = await self._call(
+                    self.transfers_control.resend_transfers_otp,
+                    pending.transfer_code,
+                    "transfer",
+                )
+                if not status:
+                    pending.last_error = data
+
+    async def start(self) -> None:
+        """
+        This function starts the finalization workers and the resend loop
+        """
+
+        self._otps = asyncio.Queue()
+        self._tasks = [
+            asyncio.ensure_future(self._finalize()) for _ in range(self.workers)
+        ]
+        self._tasks.append(asyncio.ensure_future(self._resend_expired()))
+
+    async def stop(self) -> None:
+        """
+        This function stops the orchestrator
+
+        OTPs already submitted are finalized first. Waiters of transfers
+        still without an OTP then get `(False, "Orchestrator stopped")`;
+        those transfers stay pending on Paystack's side.
+        """
+
+        if not self._tasks:
+            return
+
+        *workers, resender = self._tasks
+        resender.cancel()
+
+        # Let the workers finish the queue, unless all of them have died
+        queue_done = asyncio.ensure_future(self._otps.join())
+        live = {worker for worker in workers if not worker.done()}
+        while live and not queue_done.done():
+            await asyncio.wait({queue_done, *live}, return_when=asyncio.FIRST_COMPLETED)
+            live = {worker for worker in live if not worker.done()}
+        queue_done.cancel()
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, queue_done, return_exceptions=True)
+        self._tasks = []
+        self._otps = None
+
+        for pending in list(self.pending.values()):
+            message = "Orchestrator stopped"
+            if pending.queued:
+                message += f", {pending.queued} submitted OTP(s) were not finalized"
+            self._settle(pending, (False, message))
+
+    async def __aenter__(self) -> "TransferOTPOrchestrator":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
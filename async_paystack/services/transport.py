@@ -0,0 +1,287 @@
+# Stdlib Imports
+import asyncio
+import time
+from typing import Any, Dict, Optional, Set
+
+# Own Imports
+from async_paystack.services.exceptions import TransportClosed
+from async_paystack.services.hedging import HedgePolicy
+from async_paystack.services.scheduler import PriorityScheduler
+
+# Third Party Imports
+import httpx
+
+
+class Transport:
+    """
+    HTTP transport shared by the service classes.
+
+    Until it is opened, every request uses a short-lived client, which is
+    safe to call from repeated `asyncio.run(...)` calls. Once opened (or
+    used as an async context manager) requests reuse a pooled client, and
+    the same transport can be handed to several service classes so they
+    share its connections:
+
+        async with Transport() as transport:
+            transactions = Transactions(transport=transport)
+            verification = Verification(transport=transport)
+
+    With `http2=True` concurrent requests are multiplexed as streams over a
+    few HTTP/2 connections instead of one socket per in-flight request.
+    This needs the `h2` package (`pip install httpx[http2]`).
+
+    With a `hedge` policy, GET requests sent with `hedge=True` get a second
+    copy fired on another connection once they run past the policy's
+    delay; whichever answers first wins and the other one is cancelled.
+
+    With a `scheduler`, requests wait for a slot in their priority class
+    before being sent (see `PriorityScheduler`). A hedge is a request of its
+    own and waits for a second slot, so `max_concurrency` holds with hedging.
+
+    `http_transport` swaps the httpx transport underneath the client, e.g.
+    for the record/replay transports in `async_paystack.services.cassette`.
+
+    Every request runs in a task of its own and is tracked while in flight,
+    so a worker can be shut down without losing or duplicating payouts (see
+    `drain`):
+
+        await transport.drain(timeout=25)
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float = 30.0,
+        http2: bool = False,
+        hedge: HedgePolicy = None,
+        scheduler: PriorityScheduler = None,
+        http_transport: httpx.AsyncBaseTransport = None,
+    ) -> None:
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as exc:
+                raise ImportError(
+                    "HTTP/2 requires the h2 package, "
+                    "install it with `pip install httpx[http2]`"
+                ) from exc
+
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.timeout = timeout
+        self.http2 = http2
+        self.hedge = hedge
+        self.scheduler = scheduler
+        self.http_transport = http_transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+        self.draining = False
+        self._in_flight: Dict[asyncio.Task, str] = {}
+        # Requests cancelled by `drain`, as opposed to by their caller
+        self._aborted: Set[asyncio.Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=self.limits,
+            timeout=self.timeout,
+            http2=self.http2,
+            transport=self.http_transport,
+        )
+
+    async def open(self) -> None:
+        """
+        This function opens the pooled client, if it isn't open already
+
+        A drained transport can't be opened again, create a new one instead.
+        """
+
+        if self.draining:
+            raise TransportClosed("Transport was drained and can't be reopened")
+        if self._client is None:
+            self._client = self._build_client()
+
+    async def aclose(self) -> None:
+        """
+        This function closes the pooled client and its connections, once the
+        requests in flight have finished
+        """
+
+        if self._in_flight:
+            await asyncio.wait(list(self._in_flight))
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def drain(self, timeout: float = 30.0) -> bool:
+        """
+        This function stops accepting requests, waits for the ones in flight
+        and then closes the pooled client
+
+        Requests made once draining has started raise `TransportClosed`, and
+        so do GETs still in flight after `timeout` seconds, which are
+        cancelled. Anything else (e.g. `initiate_transfer`) may already have
+        moved money, so it is always awaited, bounded by the client timeout.
+        Only the requests themselves are cancelled, never their callers, so
+        long-lived loops can catch `TransportClosed` and wind down.
+
+        :param timeout: How long to wait for in-flight requests, in seconds
+        :type timeout: float
+        :return: True if every in-flight request finished within the timeout.
+        """
+
+        self.draining = True
+        pending: Set[asyncio.Task] = set()
+
+        if self._in_flight:
+            _, pending = await asyncio.wait(list(self._in_flight), timeout=timeout)
+            for task in pending:
+                if self._in_flight.get(task) == "GET":
+                    self._aborted.add(task)
+                    task.cancel()
+
+        await self.aclose()
+        return not pending
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        hedge: bool = False,
+        priority: str = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        This function sends a request through the pooled client, or through
+        a short-lived client if the transport isn't open
+
+        :param method: The HTTP method
+        :type method: str
+        :param url: The full URL of the request
+        :type url: str
+        :param hedge: Whether the request may be hedged, only honoured for GET \
+            requests on a transport with a hedge policy
+        :type hedge: bool
+        :param priority: The priority class of the request, only used by \
+            transports with a scheduler
+        :type priority: str
+        :param kwargs: Extra keyword arguments passed on to `httpx.AsyncClient.request`
+        :type kwargs: Any
+        :return: The response.
+        """
+
+        if self.draining:
+            raise TransportClosed("Transport is draining, no new requests accepted")
+
+        task = asyncio.ensure_future(
+            self._schedule(method, url, hedge, priority, **kwargs)
+        )
+        self._in_flight[task] = method
+        task.add_done_callback(self._forget)
+
+        try:
+            # Cancelling the caller still cancels the request with it
+            return await task
+        except asyncio.CancelledError:
+            if task in self._aborted:
+                raise TransportClosed(
+                    "Request cancelled, the transport is draining"
+                ) from None
+            raise
+        finally:
+            self._aborted.discard(task)
+
+    def _forget(self, task: asyncio.Task) -> None:
+        self._in_flight.pop(task, None)
+
+    async def _schedule(
+        self, method: str, url: str, hedge: bool, priority: str, **kwargs: Any
+    ) -> httpx.Response:
+        if self.scheduler is None:
+            return await self._dispatch(method, url, hedge, priority, **kwargs)
+
+        async with self.scheduler.slot(priority):
+            return await self._dispatch(method, url, hedge, priority, **kwargs)
+
+    async def _dispatch(
+        self, method: str, url: str, hedge: bool, priority: str, **kwargs: Any
+    ) -> httpx.Response:
+        if hedge and self.hedge is not None and method == "GET":
+            return await self._send_hedged(method, url, priority, **kwargs)
+        return await self._send(method, url, **kwargs)
+
+    async def _timed_send(
+        self, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        started = time.monotonic()
+        try:
+            response = await self._send(method, url, **kwargs)
+        except asyncio.CancelledError:
+            # A losing attempt ran at least this long; leaving it out would
+            # only keep the fast answers and drag the hedge delay down.
+            self.hedge.record(time.monotonic() - started)
+            raise
+        self.hedge.record(time.monotonic() - started)
+        return response
+
+    async def _send_hedge(
+        self, method: str, url: str, priority: str, **kwargs: Any
+    ) -> httpx.Response:
+        if self.scheduler is None:
+            return await self._timed_send(method, url, **kwargs)
+
+        async with self.scheduler.slot(priority):
+            return await self._timed_send(method, url, **kwargs)
+
+    async def _send_hedged(
+        self, method: str, url: str, priority: str, **kwargs: Any
+    ) -> httpx.Response:
+        self.hedge.on_request()
+        attempts = {asyncio.ensure_future(self._timed_send(method, url, **kwargs))}
+
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=self.hedge.delay())
+            if not done and self.hedge.try_hedge():
+                hedged = asyncio.ensure_future(
+                    self._send_hedge(method, url, priority, **kwargs)
+                )
+                attempts.add(hedged)
+
+            # Take the first attempt that succeeds, only failing if all of them do
+            pending, error = attempts, None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for attempt in done:
+                    if attempt.exception() is None:
+                        return attempt.result()
+                    error = error or attempt.exception()
+            raise error
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        if self._client is not None:
+            return await self._client.request(method, url, **kwargs)
+
+        async with self._build_client() as client:
+            return await client.request(method, url, **kwargs)
+
+    async def __aenter__(self) -> "Transport":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
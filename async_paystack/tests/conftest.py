@@ -0,0 +1,8 @@
+# Third Party Imports
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def paystack_env(monkeypatch):
+    monkeypatch.setenv("PAYSTACK_BASE_URL", "https://api.paystack.co/")
+    monkeypatch.setenv("PAYSTACK_SECRET_KEY", "sk_test_secret")
@@ -0,0 +1,66 @@
+# Stdlib Imports
+import asyncio
+from collections import Counter
+
+# Own Imports
+from async_paystack.paystack.verification import Verification
+from async_paystack.services.account_resolution import AccountResolver
+from async_paystack.services.transport import Transport
+
+# Third Party Imports
+import httpx
+import pytest
+
+
+def verification_api(calls: Counter, running: Counter, peaks: Counter) -> Verification:
+    async def handler(request):
+        account = request.url.params["account_number"]
+        bank = request.url.params["bank_code"]
+        calls[account, bank] += 1
+        running[bank] += 1
+        peaks[bank] = max(peaks[bank], running[bank])
+        await asyncio.sleep(0.05 if bank == "slow" else 0.001)
+        running[bank] -= 1
+
+        if account == "0000":
+            return httpx.Response(502, text="<html>Bad Gateway</html>")
+        data = {"account_number": account, "account_name": f"Vendor {account}"}
+        return httpx.Response(200, json={"status": True, "data": data})
+
+    transport = Transport(http_transport=httpx.MockTransport(handler))
+    return Verification(transport=transport)
+
+
+@pytest.mark.asyncio
+async def test_batch_is_deduplicated_cached_and_capped_per_bank():
+    calls, running, peaks = Counter(), Counter(), Counter()
+    resolver = AccountResolver(
+        verification_api(calls, running, peaks),
+        per_bank_concurrency=4,
+        bank_concurrency={"slow": 1},
+    )
+    accounts = [(f"{i:04}", "slow") for i in range(1, 4)]
+    accounts += [(f"{i:04}", "058") for i in range(1, 9)] * 2
+
+    results = dict([item async for item in resolver.resolve_many(accounts)])
+
+    assert len(results) == 11 and all(status for status, _ in results.values())
+    assert set(calls.values()) == {1}
+    assert peaks["slow"] == 1 and peaks["058"] <= 4
+    # The fast bank didn't queue behind the slow one
+    assert list(results)[-1][1] == "slow"
+
+    again = [item async for item in resolver.resolve_many(accounts[:3])]
+    assert len(again) == 3 and sum(calls.values()) == 11
+
+
+@pytest.mark.asyncio
+async def test_a_bad_response_only_fails_its_own_account():
+    resolver = AccountResolver(verification_api(Counter(), Counter(), Counter()))
+
+    accounts = [("0000", "058"), ("0001", "058")]
+    results = dict([item async for item in resolver.resolve_many(accounts)])
+
+    assert results[("0001", "058")][0]
+    assert results[("0000", "058")] == (False, "<html>Bad Gateway</html>")
+    assert resolver.cached("0000", "058") is None
@@ -0,0 +1,130 @@
+# Stdlib Imports
+import asyncio
+import json
+from unittest import mock
+
+# Own Imports
+from async_paystack.paystack.transfers import Transfers
+from async_paystack.paystack.transfers_control import TransfersControl
+from async_paystack.services.balance import BalanceTracker
+from async_paystack.services.transport import Transport
+
+# Third Party Imports
+import httpx
+import pytest
+
+
+def transfers_api(sent: list) -> Transfers:
+    def handler(request):
+        body = json.loads(request.content)
+        sent.append(body)
+        if body["recipient"] == "RCP_down":
+            raise httpx.ConnectError("connection reset", request=request)
+        if body["amount"] > 10_000:
+            return httpx.Response(400, json={"status": False, "message": "Too much"})
+        return httpx.Response(200, json={"status": True, "data": {"status": "success"}})
+
+    return Transfers(transport=Transport(http_transport=httpx.MockTransport(handler)))
+
+
+def control_api() -> TransfersControl:
+    control = TransfersControl()
+    control.check_balance = mock.AsyncMock(
+        return_value=(True, [{"currency": "NGN", "balance": 50_000}])
+    )
+    control.fetch_ledger_balance = mock.AsyncMock(
+        return_value=(True, [{"currency": "NGN", "balance": 42_000}])
+    )
+    return control
+
+
+@pytest.mark.asyncio
+async def test_transfers_are_debited_optimistically_and_credited_back():
+    sent = []
+    transfers = transfers_api(sent)
+    tracker = BalanceTracker(control_api(), transfers)
+    await tracker.refresh()
+
+    assert tracker.available("NGN") == 50_000
+    assert not tracker.can_pay(60_000)
+
+    # Gated through the tracker, with the currency sent to Paystack
+    assert (await tracker.initiate_transfer("balance", 5_000, "RCP_1", "a"))[0]
+    # Straight through `Transfers`, still debited
+    assert (await transfers.initiate_transfer("balance", 5_000, "RCP_1", "b"))[0]
+    # Rejected by Paystack, credited back
+    assert not (await transfers.initiate_transfer("balance", 20_000, "RCP_1", "c"))[0]
+
+    assert tracker.available("NGN") == 40_000
+    assert sent[0]["currency"] == "NGN" and "currency" not in sent[1]
+    assert await tracker.initiate_transfer("balance", 45_000, "RCP_1", "d") == (
+        False,
+        "Insufficient balance",
+    )
+
+
+@pytest.mark.asyncio
+async def test_unknown_outcome_resyncs_from_the_ledger():
+    control = control_api()
+    transfers = transfers_api([])
+    async with BalanceTracker(control, transfers, refresh_interval=60) as tracker:
+        with pytest.raises(httpx.ConnectError):
+            await transfers.initiate_transfer("balance", 5_000, "RCP_down", "a")
+        assert tracker.available("NGN") == 45_000
+
+        await asyncio.sleep(0.01)
+
+    control.fetch_ledger_balance.assert_awaited_once()
+    assert tracker.available("NGN") == 42_000
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_keeps_debits_it_may_not_reflect():
+    rejected, accepted = asyncio.Event(), asyncio.Event()
+
+    async def handler(request):
+        body = json.loads(request.content)
+        if body["recipient"] == "RCP_rejected":
+            await rejected.wait()
+            return httpx.Response(400, json={"status": False, "message": "Nope"})
+        await accepted.wait()
+        return httpx.Response(200, json={"status": True, "data": {}})
+
+    transfers = Transfers(
+        transport=Transport(http_transport=httpx.MockTransport(handler))
+    )
+    control = control_api()
+    tracker = BalanceTracker(control, transfers)
+    await tracker.refresh()
+
+    async def check_balance():
+        # Mid-refresh: the earlier transfer is rejected, a new one goes out
+        rejected.set()
+        await asyncio.sleep(0.01)
+        asyncio.ensure_future(
+            transfers.initiate_transfer("balance", 2_000, "RCP_new", "b")
+        )
+        await asyncio.sleep(0.01)
+        return True, [{"currency": "NGN", "balance": 50_000}]
+
+    control.check_balance = mock.AsyncMock(side_effect=check_balance)
+    first = asyncio.ensure_future(
+        transfers.initiate_transfer("balance", 5_000, "RCP_rejected", "a")
+    )
+    await asyncio.sleep(0)
+    await tracker.refresh()
+
+    # The rejected transfer isn't credited on top of the refreshed balance,
+    # the one started during the refresh stays debited
+    assert not (await first)[0]
+    assert tracker.available("NGN") == 48_000
+
+    accepted.set()
+    await asyncio.sleep(0.01)
+    control.check_balance.side_effect = None
+    control.check_balance.return_value = (
+        True,
+        [{"currency": "NGN", "balance": 48_000}],
+    )
+    await tracker.refresh()
+    assert tracker.available("NGN") == 48_000
@@ -0,0 +1,90 @@
+# Stdlib Imports
+import csv
+import json
+import time
+
+# Own Imports
+from async_paystack.services.export import CSVSink, NDJSONSink, ParquetSink, export
+
+# Third Party Imports
+import pytest
+
+
+def page_fetcher(total: int):
+    calls = []
+
+    async def fetch_page(per_page: int, page: int, **filters):
+        calls.append(page)
+        start = (page - 1) * per_page
+        records = [
+            {"id": i, "amount": i * 100, "customer": {"email": f"{i}@example.com"}}
+            for i in range(start, min(start + per_page, total))
+        ]
+        return True, records
+
+    return fetch_page, calls
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_projects_fields(tmp_path):
+    fetch_page, _ = page_fetcher(5)
+    path = tmp_path / "transactions.ndjson"
+
+    written = await export(
+        fetch_page, NDJSONSink(str(path)), fields=["id", "customer.email"], per_page=2
+    )
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert written == 5
+    assert lines[4] == {"id": 4, "customer.email": "4@example.com"}
+
+
+@pytest.mark.asyncio
+async def test_csv_sink_drives_projection_and_writes_nested_values_as_json(tmp_path):
+    fetch_page, _ = page_fetcher(3)
+    path = tmp_path / "transactions.csv"
+
+    await export(fetch_page, CSVSink(str(path), ["id", "customer.email", "customer"]))
+
+    with open(path, newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert rows[1] == {
+        "id": "1",
+        "customer.email": "1@example.com",
+        "customer": '{"email": "1@example.com"}',
+    }
+
+
+@pytest.mark.asyncio
+async def test_parquet_export(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    fetch_page, _ = page_fetcher(5)
+    path = tmp_path / "transactions.parquet"
+
+    sink = ParquetSink(str(path))
+    await export(fetch_page, sink, fields=["id", "amount"], per_page=2)
+
+    assert parquet.read_table(str(path)).column("amount").to_pylist()[-1] == 400
+
+
+@pytest.mark.asyncio
+async def test_fetcher_waits_for_a_slow_writer(tmp_path):
+    fetch_page, calls = page_fetcher(20)
+    ahead = []
+
+    class SlowSink:
+        pages = 0
+
+        def write(self, records):
+            self.pages += 1
+            ahead.append(len(calls) - self.pages)
+            time.sleep(0.01)
+
+        def close(self):
+            pass
+
+    written = await export(fetch_page, SlowSink(), per_page=1, max_pending_pages=2)
+
+    assert written == 20
+    # At most the queued pages plus the one blocked on `put` run ahead
+    assert max(ahead) <= 3
@@ -0,0 +1,143 @@
+# Stdlib Imports
+import json
+
+# Own Imports
+from async_paystack.paystack.plans import Plans
+from async_paystack.paystack.subscriptions import Subscriptions
+from async_paystack.paystack.transactions import Transactions
+from async_paystack.paystack.transfers import Transfers
+from async_paystack.paystack.transfers_control import TransfersControl
+from async_paystack.paystack.verification import Verification
+from async_paystack.services.transport import Transport
+
+# Third Party Imports
+import httpx
+import pytest
+
+
+def capturing_transport(sent: list, response: httpx.Response) -> Transport:
+    def handler(request):
+        sent.append(request)
+        return response
+
+    return Transport(http_transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service, call, args, method, path, query, body",
+    [
+        (
+            Transactions,
+            "list_transactions",
+            {"per_page": 50, "from_date": "2023-06-01T00:00:00.000Z"},
+            "GET",
+            "/transaction",
+            {"perPage": "50", "from": "2023-06-01T00:00:00.000Z"},
+            None,
+        ),
+        (
+            Transfers,
+            "initiate_transfer",
+            {
+                "source": "balance",
+                "amount": 5000,
+                "recipient_code": "RCP_1",
+                "reason": "Payout",
+            },
+            "POST",
+            "/transfer",
+            {},
+            {
+                "source": "balance",
+                "amount": 5000,
+                "recipient": "RCP_1",
+                "reason": "Payout",
+            },
+        ),
+        (
+            TransfersControl,
+            "resend_transfers_otp",
+            {"transfer_code": "TRF_1", "reason": "transfer"},
+            "POST",
+            "/transfer/resend_otp",
+            {},
+            {"transfer_code": "TRF_1", "reason": "transfer"},
+        ),
+        (
+            Plans,
+            "update_plan",
+            {"id_or_code": "PLN_1", "name": "Gold"},
+            "PUT",
+            "/plan/PLN_1",
+            {},
+            {"name": "Gold"},
+        ),
+        (
+            Subscriptions,
+            "generate_update_subscription_link",
+            {"code": "SUB_1"},
+            "POST",
+            "/subscription/SUB_1/manage/link/",
+            {},
+            {"code": "SUB_1"},
+        ),
+        (
+            Verification,
+            "resolves_account_number",
+            {"account_number": "0001234567", "bank_code": "058"},
+            "GET",
+            "/bank/resolve",
+            {"account_number": "0001234567", "bank_code": "058"},
+            None,
+        ),
+    ],
+)
+async def test_service_sends_the_documented_request(
+    service, call, args, method, path, query, body
+):
+    sent = []
+    response = httpx.Response(200, json={"status": True, "data": {"id": 1}})
+    api = service(transport=capturing_transport(sent, response))
+
+    assert await getattr(api, call)(**args) == (True, {"id": 1})
+
+    request = sent[0]
+    assert request.method == method
+    assert request.url.path == path
+    assert dict(request.url.params) == query
+    assert (json.loads(request.content) if request.content else None) == body
+    assert request.headers["authorization"] == "Bearer sk_test_secret"
+    assert request.headers["content-type"] == "application/json"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service, call, args",
+    [
+        (Transactions, "verify_transaction", ("ref",)),
+        (Transfers, "complete_transfer", ("TRF_1", "123456")),
+        (TransfersControl, "check_balance", ()),
+        (Plans, "fetch_plan", ("PLN_1",)),
+        (Subscriptions, "fetch_subscription", ("SUB_1",)),
+        (Verification, "resolve_card_bin", ("539983",)),
+    ],
+)
+async def test_service_returns_the_error_message(service, call, args):
+    response = httpx.Response(401, json={"status": False, "message": "Invalid key"})
+    api = service(transport=capturing_transport([], response))
+
+    assert await getattr(api, call)(*args) == (False, "Invalid key")
+
+
+@pytest.mark.asyncio
+async def test_service_returns_the_message_when_there_is_no_data():
+    response = httpx.Response(
+        200, json={"status": True, "message": "OTP has been resent"}
+    )
+    api = TransfersControl(transport=capturing_transport([], response))
+
+    assert await api.resend_transfers_otp("TRF_1", "transfer") == (
+        True,
+        "OTP has been resent",
+    )
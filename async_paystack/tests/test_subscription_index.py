@@ -0,0 +1,93 @@
+# Stdlib Imports
+from unittest import mock
+
+# Own Imports
+from async_paystack.paystack.plans import Plans
+from async_paystack.paystack.subscriptions import Subscriptions
+from async_paystack.services.subscription_index import SubscriptionIndex
+
+# Third Party Imports
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_index_answers_entitlements_and_follows_webhooks():
+    plan = {"id": 28, "plan_code": "PLN_gold", "name": "Gold"}
+    customer = {"id": 1173, "customer_code": "CUS_ada", "email": "ada@example.com"}
+    subscription = {
+        "id": 9,
+        "subscription_code": "SUB_vsyqdmlzble3uii",
+        "status": "active",
+        "customer": customer,
+        "plan": plan,
+    }
+
+    plans, subscriptions = Plans(), Subscriptions()
+    other_plan = {"id": 30, "plan_code": "PLN_x"}
+    plans.list_plans = mock.AsyncMock(return_value=(True, [plan]))
+    plans.fetch_plan = mock.AsyncMock(return_value=(True, other_plan))
+    subscriptions.list_subscriptions = mock.AsyncMock(
+        return_value=(True, [subscription])
+    )
+
+    index = SubscriptionIndex(plans, subscriptions)
+    await index.warm()
+
+    assert index.is_active("CUS_ada", "PLN_gold")
+    assert index.is_active("ada@example.com", 28)
+    assert not index.is_active("CUS_ada", "PLN_silver")
+    assert await index.plan("PLN_gold") == plan
+    assert (await index.plan("PLN_x"))["id"] == 30
+    plans.fetch_plan.assert_awaited_once_with("PLN_x")
+
+    index.apply_event(
+        {
+            "event": "subscription.disable",
+            "data": {"subscription_code": "SUB_vsyqdmlzble3uii", "status": "complete"},
+        }
+    )
+
+    assert not index.is_active("CUS_ada", "PLN_gold")
+    assert index.customer_subscriptions(1173)[0]["status"] == "complete"
+
+
+@pytest.mark.asyncio
+async def test_warm_rebuilds_the_index():
+    customer = {"id": 1173, "customer_code": "CUS_ada"}
+    subscription = {
+        "id": 9,
+        "subscription_code": "SUB_1",
+        "status": "active",
+        "customer": customer,
+        "plan": {"id": 28, "plan_code": "PLN_gold"},
+    }
+
+    plans, subscriptions = Plans(), Subscriptions()
+    plans.list_plans = mock.AsyncMock(
+        side_effect=[(True, [{"id": 28, "plan_code": "PLN_gold"}]), (True, [])]
+    )
+    subscriptions.list_subscriptions = mock.AsyncMock(
+        side_effect=[(True, [subscription]), (True, [])]
+    )
+
+    index = SubscriptionIndex(plans, subscriptions)
+    with pytest.raises(RuntimeError):
+        index.is_active("CUS_ada", "PLN_gold")
+
+    await index.warm()
+    assert index.is_active("CUS_ada", "PLN_gold")
+
+    # Moving the subscription leaves no empty entry behind for the old customer
+    index.apply_event(
+        {
+            "event": "subscription.create",
+            "data": {"subscription_code": "SUB_1", "customer": {"id": 7}},
+        }
+    )
+    assert list(index._by_customer) == ["7"]
+
+    # The plan and the subscription were deleted on Paystack's side
+    await index.warm()
+    assert not index.is_active("CUS_ada", "PLN_gold")
+    assert index.customer_subscriptions("CUS_ada") == []
+    assert not index._plans and not index._by_customer
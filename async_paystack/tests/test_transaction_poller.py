@@ -0,0 +1,83 @@
+# Stdlib Imports
+import asyncio
+import json
+from unittest import mock
+
+# Own Imports
+from async_paystack.paystack.transactions import Transactions
+from async_paystack.services.exceptions import TransportClosed
+from async_paystack.services.transaction_poller import TransactionPoller
+
+# Third Party Imports
+import pytest
+
+
+def poller_for(*responses, **kwargs) -> TransactionPoller:
+    trx = Transactions()
+    trx.verify_transaction = mock.AsyncMock(side_effect=list(responses))
+    options = {"min_interval": 0.01, "max_interval": 0.04, "tick": 0.002}
+    return TransactionPoller(trx, **{**options, **kwargs})
+
+
+async def next_changes(poller: TransactionPoller, count: int) -> list:
+    events = poller.events()
+    return [await asyncio.wait_for(events.__anext__(), 1) for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_status_changes_are_emitted_until_a_terminal_status():
+    pending, success = {"status": "pending"}, {"status": "success"}
+    poller = poller_for((True, pending), (True, pending), (True, success))
+
+    async with poller:
+        poller.track("ref")
+        changes = await next_changes(poller, 2)
+
+    assert [(c.previous, c.status) for c in changes] == [
+        (None, "pending"),
+        ("pending", "success"),
+    ]
+    assert poller.polls == 3 and "ref" not in poller.tracked
+
+
+@pytest.mark.asyncio
+async def test_unchanged_references_back_off_up_to_the_max_interval():
+    poller = poller_for(*[(True, {"status": "pending"})] * 4)
+
+    async with poller:
+        poller.track("ref", status="pending")
+        while poller.polls < 4:
+            await asyncio.sleep(0.005)
+
+    # 0.01 -> 0.02 -> 0.04 -> capped at 0.04
+    assert poller.tracked["ref"].interval == 0.04
+
+
+@pytest.mark.asyncio
+async def test_a_failed_poll_is_retried_on_a_live_worker():
+    poller = poller_for(
+        json.JSONDecodeError("Expecting value", "<html>502</html>", 0),
+        KeyError("data"),
+        (True, {"status": "success"}),
+        workers=1,
+    )
+
+    async with poller:
+        poller.track("ref")
+        (change,) = await next_changes(poller, 1)
+
+    assert change.status == "success" and poller.polls == 3
+    assert "ref" not in poller.tracked
+
+
+@pytest.mark.asyncio
+async def test_a_closed_transport_stops_the_workers():
+    poller = poller_for(TransportClosed("Transport is draining"), workers=1)
+
+    async with poller:
+        poller.track("ref")
+        worker = poller._tasks[0]
+        await asyncio.wait({worker}, timeout=1)
+
+    assert isinstance(worker.exception(), TransportClosed)
+    assert poller.polls == 1 and "ref" in poller.tracked
@@ -0,0 +1,49 @@
+# Stdlib Imports
+from unittest import mock
+
+# Own Imports
+from async_paystack.paystack.transactions import Transactions
+from async_paystack.services.transaction_sync import (
+    SQLiteCheckpointStore,
+    TransactionSync,
+)
+
+# Third Party Imports
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_sync_only_emits_deltas(tmp_path):
+    trx = Transactions()
+    first = {"id": 1, "status": "pending", "createdAt": "2023-06-01T10:00:00.000Z"}
+    second = {"id": 2, "status": "success", "createdAt": "2023-06-01T11:00:00.000Z"}
+    trx.list_transactions = mock.AsyncMock(return_value=(True, [second, first]))
+
+    store = SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+    engine = TransactionSync(trx, store=store)
+    changes = [change async for change in engine.sync()]
+
+    assert [(c.kind, c.record["id"]) for c in changes] == [("created", 2), ("created", 1)]
+    assert store.get_watermark("transactions") == ("2023-06-01T11:00:00.000Z", 2)
+
+    # Second pass: only the watermark window comes back, with `2` updated,
+    # while `1` fell out of it still pending and is re-checked by id
+    updated = dict(second, status="reversed")
+    trx.list_transactions.return_value = (True, [updated])
+    trx.fetch_transaction = mock.AsyncMock(
+        return_value=(True, dict(first, status="success"))
+    )
+    changes = [change async for change in engine.sync()]
+
+    assert [(c.kind, c.record["id"], c.record["status"]) for c in changes] == [
+        ("updated", 2, "reversed"),
+        ("updated", 1, "success"),
+    ]
+    trx.list_transactions.assert_awaited_with(
+        per_page=100, page=1, from_date="2023-06-01T10:55:00.000Z"
+    )
+    trx.fetch_transaction.assert_awaited_once_with(1)
+
+    # Settled, so it isn't re-checked again
+    assert [change async for change in engine.sync()] == []
+    trx.fetch_transaction.assert_awaited_once()
@@ -0,0 +1,162 @@
+# Stdlib Imports
+import asyncio
+from unittest import mock
+
+# Own Imports
+from async_paystack.paystack.transfers import Transfers
+from async_paystack.paystack.transfers_control import TransfersControl
+from async_paystack.services.transfer_otp import TransferOTPOrchestrator
+from async_paystack.services.transport import Transport
+
+# Third Party Imports
+import httpx
+import pytest
+
+
+def otp_transfers() -> Transfers:
+    transfers = Transfers()
+    transfers.initiate_transfer = mock.AsyncMock(
+        return_value=(True, {"transfer_code": "TRF_1", "status": "otp"})
+    )
+    return transfers
+
+
+@pytest.mark.asyncio
+async def test_otps_for_one_transfer_are_finalized_one_at_a_time():
+    transfers = otp_transfers()
+    finalizing = []
+
+    async def complete_transfer(transfer_code, otp):
+        finalizing.append(otp)
+        assert len(finalizing) == 1, "finalized concurrently"
+        await asyncio.sleep(0.01)
+        finalizing.remove(otp)
+        if otp == "000000":
+            return False, "Invalid OTP"
+        return True, {"transfer_code": transfer_code, "status": "success"}
+
+    transfers.complete_transfer = mock.AsyncMock(side_effect=complete_transfer)
+
+    async with TransferOTPOrchestrator(transfers, TransfersControl()) as otp:
+        await otp.initiate("balance", 5000, "RCP_1", "Payout")
+        waiters = [asyncio.ensure_future(otp.wait("TRF_1")) for _ in range(3)]
+
+        for code in ("000000", "123456", "654321"):
+            otp.submit_otp("TRF_1", code)
+        results = await asyncio.wait_for(asyncio.gather(*waiters), 1)
+
+        # A waiter arriving after finalization still gets the outcome
+        assert await otp.wait("TRF_1") == results[0]
+
+    assert results == [(True, {"transfer_code": "TRF_1", "status": "success"})] * 3
+    # The third OTP was dropped, the transfer was already settled
+    assert [call.args[1] for call in transfers.complete_transfer.await_args_list] == [
+        "000000",
+        "123456",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_workers_survive_error_pages():
+    responses = [
+        httpx.Response(502, text="<html>Bad Gateway</html>"),
+        httpx.Response(200, json={"status": True, "data": {"status": "success"}}),
+    ]
+    transport = Transport(
+        http_transport=httpx.MockTransport(lambda request: responses.pop(0))
+    )
+    transfers = Transfers(transport=transport)
+    transfers.initiate_transfer = mock.AsyncMock(
+        return_value=(True, {"transfer_code": "TRF_1", "status": "otp"})
+    )
+
+    async with TransferOTPOrchestrator(transfers, TransfersControl(), workers=1) as otp:
+        await otp.initiate("balance", 5000, "RCP_1", "Payout")
+        otp.submit_otp("TRF_1", "123456")
+        otp.submit_otp("TRF_1", "123456")
+
+        assert await asyncio.wait_for(otp.wait("TRF_1"), 1) == (
+            True,
+            {"status": "success"},
+        )
+
+
+@pytest.mark.asyncio
+async def test_otps_are_resent_then_given_up_on():
+    responses = [
+        httpx.Response(502, text="<html>Bad Gateway</html>"),
+        httpx.Response(200, json={"status": True, "message": "OTP has been resent"}),
+    ]
+    transport = Transport(
+        http_transport=httpx.MockTransport(lambda request: responses.pop(0))
+    )
+    control = TransfersControl(transport=transport)
+    orchestrator = TransferOTPOrchestrator(
+        otp_transfers(), control, otp_timeout=0.01, max_resends=2, check_interval=0.01
+    )
+
+    async with orchestrator as otp:
+        await otp.initiate("balance", 5000, "RCP_1", "Payout")
+        status, message = await asyncio.wait_for(otp.wait("TRF_1"), 1)
+
+    # The failed resend didn't stop the loop from resending again
+    assert not responses
+    assert (status, message) == (False, "<html>Bad Gateway</html>")
+
+
+@pytest.mark.asyncio
+async def test_a_transfer_is_not_given_up_on_while_its_otp_is_finalized():
+    transfers = otp_transfers()
+
+    async def complete_transfer(transfer_code, otp):
+        # Outlives the OTP timeout and several resend checks
+        await asyncio.sleep(0.1)
+        return True, {"transfer_code": transfer_code, "status": "success"}
+
+    transfers.complete_transfer = mock.AsyncMock(side_effect=complete_transfer)
+    control = TransfersControl()
+    control.resend_transfers_otp = mock.AsyncMock(return_value=(True, "Resent"))
+    orchestrator = TransferOTPOrchestrator(
+        transfers,
+        control,
+        workers=1,
+        otp_timeout=0.01,
+        max_resends=0,
+        check_interval=0.01,
+    )
+
+    async with orchestrator as otp:
+        await otp.initiate("balance", 5000, "RCP_1", "Payout")
+        otp.submit_otp("TRF_1", "123456")
+
+        assert await asyncio.wait_for(otp.wait("TRF_1"), 1) == (
+            True,
+            {"transfer_code": "TRF_1", "status": "success"},
+        )
+
+
+@pytest.mark.asyncio
+async def test_stop_finalizes_queued_otps_and_releases_waiters():
+    transfers = otp_transfers()
+    transfers.initiate_transfer = mock.AsyncMock(
+        side_effect=[
+            (True, {"transfer_code": "TRF_1", "status": "otp"}),
+            (True, {"transfer_code": "TRF_2", "status": "otp"}),
+        ]
+    )
+    transfers.complete_transfer = mock.AsyncMock(
+        return_value=(True, {"status": "success"})
+    )
+
+    otp = TransferOTPOrchestrator(transfers, TransfersControl(), workers=1)
+    await otp.start()
+    await otp.initiate("balance", 5000, "RCP_1", "Payout")
+    await otp.initiate("balance", 5000, "RCP_2", "Payout")
+    waiters = [asyncio.ensure_future(otp.wait(code)) for code in ("TRF_1", "TRF_2")]
+    otp.submit_otp("TRF_1", "123456")
+    await otp.stop()
+
+    assert await asyncio.wait_for(asyncio.gather(*waiters), 1) == [
+        (True, {"status": "success"}),
+        (False, "Orchestrator stopped"),
+    ]
@@ -0,0 +1,237 @@
+# Stdlib Imports
+import asyncio
+
+# Own Imports
+from async_paystack.paystack.transactions import Transactions
+from async_paystack.paystack.transfers import Transfers
+from async_paystack.paystack.verification import Verification
+from async_paystack.services.cassette import (
+    Cassette,
+    RecordingTransport,
+    ReplayTransport,
+)
+from async_paystack.services.exceptions import TransportClosed
+from async_paystack.services.hedging import HedgePolicy
+from async_paystack.services.profiling import Profiler
+from async_paystack.services.scheduler import PriorityScheduler
+from async_paystack.services.transport import Transport
+
+# Third Party Imports
+import httpx
+import pytest
+
+
+def mocked_transport(handler, **kwargs) -> Transport:
+    return Transport(http_transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_verify_transaction_is_hedged_past_the_delay():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        # The first attempt hangs, the hedged one answers straight away
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        data = {"attempt": len(calls)}
+        return httpx.Response(200, json={"status": True, "data": data})
+
+    policy = HedgePolicy(initial_delay=0.01, budget=1)
+    async with Transactions(transport=mocked_transport(handler, hedge=policy)) as trx:
+        status, data = await asyncio.wait_for(trx.verify_transaction("ref"), 1)
+
+    assert (status, data) == (True, {"attempt": 2})
+    assert calls == ["/transaction/verify/ref"] * 2
+    assert policy.hedged == 1
+
+    # The cancelled first attempt still counts, as a lower bound
+    await asyncio.sleep(0)
+    assert len(policy._latencies) == 2 and max(policy._latencies) >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_hedging_stops_when_the_budget_is_spent():
+    async def handler(request):
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"status": True, "data": {}})
+
+    policy = HedgePolicy(initial_delay=0.001, budget=0.5, burst=1)
+    async with Transactions(transport=mocked_transport(handler, hedge=policy)) as trx:
+        for _ in range(4):
+            await trx.verify_transaction("ref")
+
+    assert policy.hedged == 2
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_jump_ahead_of_queued_bulk_work():
+    served = []
+
+    async def handler(request):
+        served.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"status": True, "data": []})
+
+    scheduler = PriorityScheduler(max_concurrency=1)
+    async with mocked_transport(handler, scheduler=scheduler) as transport:
+        exports = Transactions(transport=transport, priority="bulk")
+        checkout = Transactions(transport=transport, priority="interactive")
+
+        bulk = [asyncio.ensure_future(exports.list_transactions()) for _ in range(3)]
+        await asyncio.sleep(0)
+        await asyncio.gather(checkout.verify_transaction("ref"), *bulk)
+
+    assert served == ["/transaction", "/transaction/verify/ref"] + ["/transaction"] * 2
+
+
+@pytest.mark.asyncio
+async def test_hedges_wait_for_a_scheduler_slot_of_their_own():
+    running, peak = [], []
+
+    async def handler(request):
+        running.append(request)
+        peak.append(len(running))
+        await asyncio.sleep(0.05)
+        running.remove(request)
+        return httpx.Response(200, json={"status": True, "data": {}})
+
+    policy = HedgePolicy(initial_delay=0.001, budget=1)
+    scheduler = PriorityScheduler(max_concurrency=1)
+    transport = mocked_transport(handler, hedge=policy, scheduler=scheduler)
+    async with transport:
+        await Transactions(transport=transport).verify_transaction("ref")
+
+    # The hedge was allowed, but queued until the first attempt had answered
+    assert policy.hedged == 1
+    assert peak == [1]
+
+
+@pytest.mark.asyncio
+async def test_profiler_records_per_endpoint_measurements():
+    page = [{"id": index, "status": "success"} for index in range(100)]
+
+    def handler(request):
+        return httpx.Response(200, json={"status": True, "data": page})
+
+    profiler = Profiler()
+    trx = Transactions(transport=mocked_transport(handler), profiler=profiler)
+    for _ in range(2):
+        await trx.list_transactions(per_page=100)
+    profiler.close()
+
+    report = profiler.report()
+    assert list(report) == ["GET transaction"]
+    stats = report["GET transaction"]
+    assert stats["calls"] == 2
+    assert stats["max_response_bytes"] > 100 * len('{"id":0}')
+    assert stats["peak_allocated_bytes"] > 0
+    assert stats["overlapped_calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_profiler_aggregates_by_path_template_and_flags_overlaps():
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"status": True, "data": {}})
+
+    profiler = Profiler()
+    trx = Transactions(transport=mocked_transport(handler), profiler=profiler)
+    await asyncio.gather(trx.verify_transaction("a"), trx.verify_transaction("b"))
+    await trx.verify_transaction("c")
+    profiler.close()
+
+    stats = profiler.report()["GET transaction/verify/{ref}"]
+    assert (stats["calls"], stats["overlapped_calls"]) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_recorded_traffic_replays_without_network(tmp_path):
+    def handler(request):
+        name = request.url.params["account_number"]
+        return httpx.Response(200, json={"status": True, "data": {"name": name}})
+
+    cassette = Cassette()
+    recorder = RecordingTransport(cassette, httpx.MockTransport(handler))
+    async with Verification(transport=Transport(http_transport=recorder)) as kyc:
+        recorded = await kyc.resolves_account_number("0001", "058")
+    cassette.save(str(tmp_path / "paystack.ndjson.gz"))
+
+    replay = ReplayTransport(Cassette.load(str(tmp_path / "paystack.ndjson.gz")))
+    kyc = Verification(transport=Transport(http_transport=replay))
+    replayed = await asyncio.gather(
+        *(kyc.resolves_account_number("0001", "058") for _ in range(3))
+    )
+
+    assert recorded == (True, {"name": "0001"})
+    assert replayed == [recorded] * 3
+
+
+def draining_handler(transfer_seconds: float):
+    async def handler(request):
+        if request.method == "POST":
+            await asyncio.sleep(transfer_seconds)
+            return httpx.Response(200, json={"status": True, "data": {"id": 1}})
+        await asyncio.sleep(10)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_drain_finishes_transfers_and_cancels_stuck_reads():
+    transport = mocked_transport(draining_handler(0.1))
+    await transport.open()
+    transfers = Transfers(transport=transport)
+    trx = Transactions(transport=transport)
+
+    async def poll_worker():
+        # A long-lived loop, it must see the drain rather than be cancelled
+        closed = 0
+        while closed < 2:
+            try:
+                await trx.verify_transaction("ref")
+            except TransportClosed:
+                closed += 1
+        return closed
+
+    transfer = asyncio.ensure_future(
+        transfers.initiate_transfer("balance", 5000, "RCP_1", "payout")
+    )
+    worker = asyncio.ensure_future(poll_worker())
+    await asyncio.sleep(0.01)
+
+    drained = await transport.drain(timeout=0.02)
+
+    assert not drained
+    assert await transfer == (True, {"id": 1})
+    assert await worker == 2
+    assert transport.in_flight == 0 and not transport.is_open
+    with pytest.raises(TransportClosed):
+        await trx.verify_transaction("ref")
+
+
+@pytest.mark.asyncio
+async def test_services_entered_during_a_drain_leave_the_transport_alone():
+    transport = mocked_transport(draining_handler(0.05))
+    await transport.open()
+    transfers = Transfers(transport=transport)
+
+    transfer = asyncio.ensure_future(
+        transfers.initiate_transfer("balance", 5000, "RCP_1", "payout")
+    )
+    await asyncio.sleep(0.01)
+    drain = asyncio.ensure_future(transport.drain(timeout=1))
+    await asyncio.sleep(0)
+
+    async with Transactions(transport=transport) as trx:
+        with pytest.raises(TransportClosed):
+            await trx.verify_transaction("ref")
+
+    # Leaving the service didn't reopen intake or close the pool under the transfer
+    assert transport.draining and transport.is_open and transport.in_flight == 1
+    with pytest.raises(TransportClosed):
+        await transport.open()
+
+    assert await drain
+    assert await transfer == (True, {"id": 1})
+    assert not transport.is_open
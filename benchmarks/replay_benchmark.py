@@ -0,0 +1,112 @@
+"""
+Records Paystack traffic to a cassette, then replays it through every service
+class to measure the library's own overhead without network.
+
+Record once against a test key (or a local simulator), the scenario only
+makes read-only calls:
+
+    python -m benchmarks.replay_benchmark record paystack.ndjson.gz --reference REF
+
+Then replay it as often as needed, e.g. in CI:
+
+    python -m benchmarks.replay_benchmark replay paystack.ndjson.gz \\
+        --iterations 200 --concurrency 20 --speed 0 --profile
+"""
+
+# Stdlib Imports
+import argparse
+import asyncio
+import json
+import time
+
+# Own Imports
+from async_paystack.paystack.plans import Plans
+from async_paystack.paystack.subscriptions import Subscriptions
+from async_paystack.paystack.transactions import Transactions
+from async_paystack.paystack.transfers import Transfers
+from async_paystack.paystack.transfers_control import TransfersControl
+from async_paystack.paystack.verification import Verification
+from async_paystack.services.cassette import (
+    Cassette,
+    RecordingTransport,
+    ReplayTransport,
+)
+from async_paystack.services.profiling import Profiler
+from async_paystack.services.transport import Transport
+
+
+async def scenario(services: dict, args: argparse.Namespace) -> None:
+    await asyncio.gather(
+        services["transactions"].list_transactions(per_page=50),
+        services["transactions"].verify_transaction(args.reference),
+        services["transfers"].list_transfers(per_page=50),
+        services["transfers_control"].check_balance(),
+        services["plans"].list_plans(),
+        services["subscriptions"].list_subscriptions(),
+        services["verification"].resolve_card_bin(args.bin),
+    )
+
+
+def build_services(transport: Transport, profiler: Profiler = None) -> dict:
+    return {
+        "transactions": Transactions(transport=transport, profiler=profiler),
+        "transfers": Transfers(transport=transport, profiler=profiler),
+        "transfers_control": TransfersControl(transport=transport, profiler=profiler),
+        "plans": Plans(transport=transport, profiler=profiler),
+        "subscriptions": Subscriptions(transport=transport, profiler=profiler),
+        "verification": Verification(transport=transport, profiler=profiler),
+    }
+
+
+async def record(args: argparse.Namespace) -> None:
+    cassette = Cassette()
+    async with Transport(http_transport=RecordingTransport(cassette)) as transport:
+        await scenario(build_services(transport), args)
+
+    cassette.save(args.cassette)
+    print(f"Recorded {len(cassette.interactions)} interactions to {args.cassette}")
+
+
+async def replay(args: argparse.Namespace) -> None:
+    replayer = ReplayTransport(Cassette.load(args.cassette), speed=args.speed)
+    profiler = Profiler() if args.profile else None
+    slots = asyncio.Semaphore(args.concurrency)
+
+    async with Transport(http_transport=replayer) as transport:
+        services = build_services(transport, profiler)
+
+        async def run_once() -> None:
+            async with slots:
+                await scenario(services, args)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(run_once() for _ in range(args.iterations)))
+        elapsed = time.perf_counter() - started
+
+    print(
+        f"Replayed {replayer.replayed} requests in {elapsed:.3f}s "
+        f"({replayer.replayed / elapsed:.0f} req/s, "
+        f"{elapsed / replayer.replayed * 1e6:.0f} us/request)"
+    )
+    if profiler is not None:
+        profiler.close()
+        print(json.dumps(profiler.report(), indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("cassette")
+    parser.add_argument("--reference", default="benchmark-reference")
+    parser.add_argument("--bin", default="539983")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--speed", type=float, default=0)
+    parser.add_argument("--profile", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(record(args) if args.mode == "record" else replay(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Minimal local stand-in for the Paystack API, used by the benchmarks.
+
+Every request is answered with the same small JSON document after `latency`
+seconds. The server speaks HTTP/1.1 (keep-alive) and cleartext HTTP/2 with
+prior knowledge on the same port, picking the protocol from the first bytes
+of each connection.
+"""
+
+# Stdlib Imports
+import asyncio
+import json
+
+# Third Party Imports
+import h11
+import h2.config
+import h2.connection
+import h2.events
+
+
+H2_PREFACE = b"PRI * HTTP/2.0"
+BODY = json.dumps(
+    {"status": True, "message": "Verification successful", "data": {"id": 1}}
+).encode()
+HEADERS = [("content-type", "application/json"), ("content-length", str(len(BODY)))]
+
+
+class Simulator:
+    """
+    Serves canned Paystack responses on `127.0.0.1`, counting the
+    connections it accepts:
+
+        async with Simulator(latency=0.02) as simulator:
+            os.environ["PAYSTACK_BASE_URL"] = simulator.base_url
+    """
+
+    def __init__(self, latency: float = 0.02) -> None:
+        self.latency = latency
+        self.base_url = ""
+        self.connections = 0
+        self._server: asyncio.AbstractServer = None
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            data = await reader.read(65536)
+            if data.startswith(H2_PREFACE):
+                await self._serve_h2(data, reader, writer)
+            else:
+                await self._serve_h11(data, reader, writer)
+        except (ConnectionError, h11.RemoteProtocolError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_h11(
+        self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = h11.Connection(h11.SERVER)
+        while data:
+            connection.receive_data(data)
+            while True:
+                event = connection.next_event()
+                if event is h11.NEED_DATA:
+                    break
+                if isinstance(event, h11.ConnectionClosed):
+                    return
+                if isinstance(event, h11.EndOfMessage):
+                    await asyncio.sleep(self.latency)
+                    writer.write(
+                        connection.send(h11.Response(status_code=200, headers=HEADERS))
+                        + connection.send(h11.Data(data=BODY))
+                        + connection.send(h11.EndOfMessage())
+                    )
+                    connection.start_next_cycle()
+            data = await reader.read(65536)
+
+    async def _serve_h2(
+        self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        config = h2.config.H2Configuration(client_side=False)
+        connection = h2.connection.H2Connection(config=config)
+        connection.initiate_connection()
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.latency)
+            connection.send_headers(stream_id, [(":status", "200"), *HEADERS])
+            connection.send_data(stream_id, BODY, end_stream=True)
+            writer.write(connection.data_to_send())
+
+        responses = set()
+        while data:
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.ensure_future(respond(event.stream_id))
+                    responses.add(task)
+                    task.add_done_callback(responses.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(connection.data_to_send())
+            data = await reader.read(65536)
+
+    async def __aenter__(self) -> "Simulator":
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}/"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
@@ -0,0 +1,108 @@
+"""
+Compares throughput of the pooled HTTP/1.1 transport against the HTTP/2
+transport under the same concurrency.
+
+Both runs fire `--requests` calls of `Transactions.verify_transaction` with at
+most `--concurrency` in flight, against `PAYSTACK_BASE_URL` (a test key, the
+calls are read-only):
+
+    pip install httpx[http2]
+    python -m benchmarks.transport_benchmark --requests 1000 --concurrency 50
+
+or against the local simulator in `benchmarks.simulator`, which answers every
+request after `--latency` seconds over cleartext HTTP/2 (prior knowledge) or
+HTTP/1.1:
+
+    python -m benchmarks.transport_benchmark --simulate --latency 0.02
+"""
+
+# Stdlib Imports
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List
+
+# Own Imports
+from async_paystack.paystack.transactions import Transactions
+from async_paystack.services.transport import Transport
+from benchmarks.simulator import Simulator
+
+# Third Party Imports
+import httpx
+
+
+async def run(
+    http2: bool,
+    requests: int,
+    concurrency: int,
+    reference: str,
+    simulator: Simulator = None,
+) -> None:
+    slots = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def call(trx: Transactions) -> None:
+        async with slots:
+            started = time.perf_counter()
+            await trx.verify_transaction(reference)
+            latencies.append(time.perf_counter() - started)
+
+    transport = Transport(max_connections=concurrency, http2=http2)
+    if simulator is not None:
+        # No TLS, so no ALPN: HTTP/2 has to be spoken with prior knowledge
+        os.environ["PAYSTACK_BASE_URL"] = simulator.base_url
+        os.environ.setdefault("PAYSTACK_SECRET_KEY", "sk_test_simulator")
+        transport.http_transport = httpx.AsyncHTTPTransport(
+            http1=not http2, http2=http2, limits=transport.limits
+        )
+        simulator.connections = 0
+
+    async with transport:
+        trx = Transactions(transport=transport)
+        # Warm up the pool so connection setup isn't part of the measurement
+        await asyncio.gather(*(call(trx) for _ in range(concurrency)))
+        latencies.clear()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(call(trx) for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(
+        f"{'HTTP/2' if http2 else 'HTTP/1.1':<9}"
+        f"{requests / elapsed:>10.1f} req/s"
+        f"  p50 {statistics.median(latencies) * 1000:>7.1f} ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:>7.1f} ms"
+        + (f"  {simulator.connections:>4} connections" if simulator else "")
+    )
+
+
+async def simulate(args: argparse.Namespace) -> None:
+    async with Simulator(latency=args.latency) as simulator:
+        for http2 in (False, True):
+            await run(
+                http2, args.requests, args.concurrency, args.reference, simulator
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--reference", default="benchmark-reference")
+    parser.add_argument("--simulate", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    if args.simulate:
+        asyncio.run(simulate(args))
+        return
+
+    for http2 in (False, True):
+        asyncio.run(run(http2, args.requests, args.concurrency, args.reference))
+
+
+if __name__ == "__main__":
+    main()